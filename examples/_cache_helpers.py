@@ -0,0 +1,71 @@
+"""Caching helpers shared by the example reports.
+
+The example scripts put ``examples/`` on ``sys.path`` and import these, so a
+warm re-run reuses parsed CSVs and chart PNGs instead of redoing the work.
+Requires pandas; matplotlib is only imported when a chart has to be drawn.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from notebookmd import cache_data
+from notebookmd.cache import _code_fingerprint, get_cache_manager
+
+
+@cache_data(show_spinner=False)
+def _read_csv(path: str, mtime_ns: int, size: int, parse_dates: tuple[str, ...]):
+    import pandas as pd
+
+    return pd.read_csv(path, parse_dates=list(parse_dates))
+
+
+def cached_read_csv(path: Path, parse_dates: tuple[str, ...] = ()):
+    """Read a CSV once; reruns reuse the parsed frame until the file changes."""
+    st = path.stat()
+    return _read_csv(str(path), st.st_mtime_ns, st.st_size, parse_dates)
+
+
+def cached_figure(
+    n: Any, filename: str, caption: str, inputs: Any, draw: Callable[[Any], Any], version: int = 1
+) -> None:
+    """Emit a chart, reusing the PNG drawn on an earlier run of the same chart.
+
+    ``inputs`` is the DataFrame/Series the chart is drawn from; ``draw(plt)``
+    builds and returns the figure and is only called on a cache miss, so a warm
+    run never imports matplotlib. On a miss the figure goes through
+    ``n.figure()``, so the notebook's PNG settings apply, and the saved bytes
+    are kept in the data cache: one entry per chart, overwritten on redraw and
+    removed by ``notebookmd cache clear``. The entry is keyed by ``inputs``, the
+    code of ``draw``, the PNG settings and ``version``. Editing ``draw`` redraws
+    the chart on the next run; bump ``version`` when the chart also depends on
+    code outside ``draw``.
+    """
+    import pandas as pd
+
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(pd.util.hash_pandas_object(inputs, index=False).values.tobytes())
+    digest.update(_code_fingerprint(draw.__code__))
+    digest.update(repr((version, n.cfg.png_compress_level, n.cfg.tight_bbox)).encode())
+    out_file = n.assets_path / filename
+    location = hashlib.blake2b(str(out_file.resolve()).encode(), digest_size=4).hexdigest()
+    key = f"figure-{Path(filename).stem}-{location}"
+
+    cache = get_cache_manager()
+    cached = cache.get_data(key)
+    if isinstance(cached, tuple) and cached[0] == digest.hexdigest():
+        out_file.parent.mkdir(parents=True, exist_ok=True)
+        out_file.write_bytes(cached[1])
+        n.figure_file(out_file, filename, caption=caption)
+        return
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    n.figure(draw(plt), filename, caption=caption)
+    cache.put_data(key, (digest.hexdigest(), out_file.read_bytes()))
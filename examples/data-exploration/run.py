@@ -15,29 +15,27 @@ Run:
 
 from __future__ import annotations
 
+import importlib.util
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # shared example helpers
+
+from _cache_helpers import cached_figure, cached_read_csv
 
 from notebookmd import NotebookConfig, nb
 
 try:
+    import numpy as np
     import pandas as pd
 
     HAS_PANDAS = True
 except ImportError:
     HAS_PANDAS = False
 
-try:
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.pyplot as plt
-
-    HAS_MPL = True
-except ImportError:
-    HAS_MPL = False
+# matplotlib is only imported once a chart actually has to be drawn.
+HAS_MPL = importlib.util.find_spec("matplotlib") is not None
 
 HERE = Path(__file__).resolve().parent
 
@@ -52,7 +50,12 @@ def main():
         return
 
     # ── Load Data ──
-    df = pd.read_csv(HERE / "data" / "employees.csv", parse_dates=["hire_date"])
+    df = cached_read_csv(HERE / "data" / "employees.csv", parse_dates=("hire_date",))
+    # Compact dtypes: categorical group keys and narrow numbers for the repeated groupbys.
+    df = df.astype({"department": "category", "city": "category", "remote": "category"})
+    df["salary"] = pd.to_numeric(df["salary"], downcast="integer")
+    df["performance_score"] = df["performance_score"].astype("float32")
+    df["years_experience"] = pd.to_numeric(df["years_experience"], downcast="integer")
 
     # ══════════════════════════════════════════════════════════════
     # DATASET OVERVIEW
@@ -82,26 +85,34 @@ def main():
     # ══════════════════════════════════════════════════════════════
     n.section("Department Analysis")
 
+    # One groupby pass feeds both the department and salary tables, and the
+    # per-department frames are reused by the tabs and the box plot.
+    dept_stats = df.groupby("department", observed=True).agg(
+        headcount=("emp_id", "count"),
+        avg_salary=("salary", "mean"),
+        median_salary=("salary", "median"),
+        min_salary=("salary", "min"),
+        max_salary=("salary", "max"),
+        avg_performance=("performance_score", "mean"),
+        avg_experience=("years_experience", "mean"),
+    )
+    dept_groups = dict(list(df.groupby("department", observed=True)))
+
     dept_summary = (
-        df.groupby("department")
-        .agg(
-            headcount=("emp_id", "count"),
-            avg_salary=("salary", "mean"),
-            avg_performance=("performance_score", "mean"),
-            avg_experience=("years_experience", "mean"),
-        )
+        dept_stats[["headcount", "avg_salary", "avg_performance", "avg_experience"]]
         .round(1)
         .sort_values("headcount", ascending=False)
         .reset_index()
     )
-    dept_summary["avg_salary"] = dept_summary["avg_salary"].apply(lambda x: f"${x:,.0f}")
+    dept_summary["avg_salary"] = [f"${x:,.0f}" for x in dept_summary["avg_salary"].to_numpy()]
     n.table(dept_summary, name="Department Summary")
 
-    tabs = n.tabs(["Engineering", "Product", "Design", "Sales", "Other"])
+    tab_depts = ["Engineering", "Product", "Design", "Sales"]
+    tabs = n.tabs([*tab_depts, "Other"])
 
-    for dept in ["Engineering", "Product", "Design", "Sales"]:
+    for dept in tab_depts:
         with tabs.tab(dept):
-            dept_df = df[df["department"] == dept]
+            dept_df = dept_groups.get(dept, df.iloc[:0])
             n.stats(
                 [
                     {"label": "Headcount", "value": str(len(dept_df))},
@@ -115,63 +126,89 @@ def main():
             )
 
     with tabs.tab("Other"):
-        other = df[~df["department"].isin(["Engineering", "Product", "Design", "Sales"])]
+        # Remaining departments come from the same partition, back in file order.
+        other_groups = [group for dept, group in dept_groups.items() if dept not in tab_depts]
+        other = pd.concat(other_groups).sort_index() if other_groups else df.iloc[:0]
         n.table(
             other[["name", "department", "title", "salary"]],
             name="Other Departments",
         )
 
     if HAS_MPL:
-        fig, ax = plt.subplots(figsize=(8, 4))
-        dept_counts = df["department"].value_counts()
-        ax.barh(dept_counts.index, dept_counts.values, color="#7c3aed")
-        ax.set_xlabel("Headcount")
-        ax.set_title("Headcount by Department")
-        ax.grid(True, alpha=0.3, axis="x")
-        fig.tight_layout()
-        n.figure(fig, "dept_headcount.png", caption="Employee distribution across departments")
-        plt.close(fig)
+
+        def draw_headcount(plt):
+            fig, ax = plt.subplots(figsize=(8, 4))
+            # Largest first, ties in order of first appearance (value_counts order).
+            dept_counts = (
+                dept_stats["headcount"]
+                .reindex(df["department"].unique().tolist())
+                .sort_values(ascending=False, kind="stable")
+            )
+            ax.barh(dept_counts.index, dept_counts.values, color="#7c3aed")
+            ax.set_xlabel("Headcount")
+            ax.set_title("Headcount by Department")
+            ax.grid(True, alpha=0.3, axis="x")
+            fig.tight_layout()
+            return fig
+
+        cached_figure(
+            n,
+            "dept_headcount.png",
+            "Employee distribution across departments",
+            df["department"],
+            draw_headcount,
+        )
 
     # ══════════════════════════════════════════════════════════════
     # SALARY ANALYSIS
     # ══════════════════════════════════════════════════════════════
     n.section("Salary Analysis")
 
+    salary = df["salary"].to_numpy()
+    salary_median, salary_min, salary_max = np.quantile(salary, [0.5, 0.0, 1.0])
     n.metric_row(
         [
-            {"label": "Median Salary", "value": f"${df['salary'].median():,.0f}"},
-            {"label": "Mean Salary", "value": f"${df['salary'].mean():,.0f}"},
-            {"label": "Min", "value": f"${df['salary'].min():,.0f}"},
-            {"label": "Max", "value": f"${df['salary'].max():,.0f}"},
+            {"label": "Median Salary", "value": f"${salary_median:,.0f}"},
+            {"label": "Mean Salary", "value": f"${salary.mean():,.0f}"},
+            {"label": "Min", "value": f"${salary_min:,.0f}"},
+            {"label": "Max", "value": f"${salary_max:,.0f}"},
         ]
     )
 
     # Salary by department
     salary_by_dept = (
-        df.groupby("department")["salary"]
-        .agg(["mean", "median", "min", "max"])
+        dept_stats[["avg_salary", "median_salary", "min_salary", "max_salary"]]
         .round(0)
-        .sort_values("mean", ascending=False)
+        .sort_values("avg_salary", ascending=False)
         .reset_index()
     )
     salary_by_dept.columns = ["Department", "Mean", "Median", "Min", "Max"]
     n.table(salary_by_dept, name="Salary by Department")
 
     if HAS_MPL:
-        fig, ax = plt.subplots(figsize=(10, 4))
-        departments = df["department"].unique()
-        salary_data = [df[df["department"] == d]["salary"].values for d in departments]
-        bp = ax.boxplot(salary_data, labels=departments, patch_artist=True)
-        colors = ["#2563eb", "#7c3aed", "#059669", "#dc2626", "#f59e0b", "#6366f1", "#0891b2"]
-        for patch, color in zip(bp["boxes"], colors, strict=False):
-            patch.set_facecolor(color)
-            patch.set_alpha(0.6)
-        ax.set_ylabel("Salary ($)")
-        ax.set_title("Salary Distribution by Department")
-        ax.grid(True, alpha=0.3, axis="y")
-        fig.tight_layout()
-        n.figure(fig, "salary_distribution.png", caption="Box plot of salary ranges across departments")
-        plt.close(fig)
+
+        def draw_salary_distribution(plt):
+            fig, ax = plt.subplots(figsize=(10, 4))
+            departments = df["department"].unique()
+            salary_data = [dept_groups[d]["salary"].values for d in departments]
+            bp = ax.boxplot(salary_data, labels=departments, patch_artist=True)
+            colors = ["#2563eb", "#7c3aed", "#059669", "#dc2626", "#f59e0b", "#6366f1", "#0891b2"]
+            for patch, color in zip(bp["boxes"], colors, strict=False):
+                patch.set_facecolor(color)
+                patch.set_alpha(0.6)
+            ax.set_ylabel("Salary ($)")
+            ax.set_title("Salary Distribution by Department")
+            ax.grid(True, alpha=0.3, axis="y")
+            fig.tight_layout()
+            return fig
+
+        cached_figure(
+            n,
+            "salary_distribution.png",
+            "Box plot of salary ranges across departments",
+            df[["department", "salary"]],
+            draw_salary_distribution,
+        )
 
     # ══════════════════════════════════════════════════════════════
     # PERFORMANCE ANALYSIS
@@ -186,39 +223,48 @@ def main():
         name="Top Performers",
     )
 
-    for i, row in top.iterrows():
-        n.ranking(
-            row["name"],
-            row["performance_score"],
-            rank=list(top.index).index(i) + 1,
-            total=len(df),
-            fmt=".1f",
-        )
+    for rank, row in enumerate(top.itertuples(index=False), start=1):
+        n.ranking(row.name, row.performance_score, rank=rank, total=len(df), fmt=".1f")
 
     # Performance vs salary correlation
     with n.expander("Performance vs Salary", expanded=True):
         n.write("Examining the relationship between performance scores and compensation.")
 
         if HAS_MPL:
-            fig, ax = plt.subplots(figsize=(8, 5))
-            scatter = ax.scatter(
-                df["years_experience"],
-                df["salary"],
-                c=df["performance_score"],
-                cmap="RdYlGn",
-                s=80,
-                alpha=0.8,
-                edgecolors="white",
-                linewidth=0.5,
+
+            def draw_perf_vs_salary(plt):
+                fig, ax = plt.subplots(figsize=(8, 5))
+                # Map scores to colors up front and label three levels in a
+                # legend; a colorbar adds a second axes to lay out and draw.
+                cmap = plt.get_cmap("RdYlGn")
+                perf = df["performance_score"].to_numpy()
+                lo, span = perf.min(), (perf.max() - perf.min()) or 1.0
+                ax.scatter(
+                    df["years_experience"],
+                    df["salary"],
+                    c=cmap((perf - lo) / span),
+                    s=80,
+                    alpha=0.8,
+                    edgecolors="white",
+                    linewidth=0.5,
+                )
+                for level in (lo, lo + span / 2, lo + span):
+                    ax.scatter([], [], color=cmap((level - lo) / span), s=80, label=f"{level:.1f}")
+                ax.legend(title="Performance Score", loc="lower right", fontsize=8)
+                ax.set_xlabel("Years of Experience")
+                ax.set_ylabel("Salary ($)")
+                ax.set_title("Salary vs Experience (colored by Performance)")
+                ax.grid(True, alpha=0.3)
+                fig.tight_layout()
+                return fig
+
+            cached_figure(
+                n,
+                "perf_vs_salary.png",
+                "Each dot represents an employee",
+                df[["years_experience", "salary", "performance_score"]],
+                draw_perf_vs_salary,
             )
-            plt.colorbar(scatter, ax=ax, label="Performance Score")
-            ax.set_xlabel("Years of Experience")
-            ax.set_ylabel("Salary ($)")
-            ax.set_title("Salary vs Experience (colored by Performance)")
-            ax.grid(True, alpha=0.3)
-            fig.tight_layout()
-            n.figure(fig, "perf_vs_salary.png", caption="Each dot represents an employee")
-            plt.close(fig)
 
     # ══════════════════════════════════════════════════════════════
     # REMOTE WORK ANALYSIS
@@ -229,13 +275,20 @@ def main():
     remote_pct = remote_counts.get("yes", 0) / len(df) * 100
     n.stat("Remote Workers", f"{remote_counts.get('yes', 0)}/{len(df)}", description=f"{remote_pct:.0f}% of workforce")
 
-    remote_salary = df.groupby("remote")["salary"].mean()
+    remote_salary = df.groupby("remote", observed=True)["salary"].mean()
     n.kv(
         {f"Remote = {k}": f"${v:,.0f}" for k, v in remote_salary.items()},
         title="Average Salary by Work Mode",
     )
 
-    remote_by_dept = pd.crosstab(df["department"], df["remote"])
+    # Both keys are categorical, so the crosstab is one bincount over combined codes.
+    depts, modes = df["department"].cat.categories, df["remote"].cat.categories
+    codes = df["department"].cat.codes.to_numpy() * len(modes) + df["remote"].cat.codes.to_numpy()
+    remote_by_dept = pd.DataFrame(
+        np.bincount(codes, minlength=len(depts) * len(modes)).reshape(len(depts), len(modes)),
+        index=pd.Index(depts, name="department"),
+        columns=pd.Index(modes, name="remote"),
+    )
     n.table(remote_by_dept.reset_index(), name="Remote Distribution by Department")
 
     # ══════════════════════════════════════════════════════════════
@@ -244,18 +297,19 @@ def main():
     n.section("City Breakdown")
 
     city_summary = (
-        df.groupby("city")
+        df.assign(remote_pct=df["remote"].eq("yes") * 100.0)
+        .groupby("city", observed=True)
         .agg(
             headcount=("emp_id", "count"),
             avg_salary=("salary", "mean"),
-            remote_pct=("remote", lambda x: (x == "yes").mean() * 100),
+            remote_pct=("remote_pct", "mean"),
         )
         .round(1)
         .sort_values("headcount", ascending=False)
         .reset_index()
     )
-    city_summary["avg_salary"] = city_summary["avg_salary"].apply(lambda x: f"${x:,.0f}")
-    city_summary["remote_pct"] = city_summary["remote_pct"].apply(lambda x: f"{x:.0f}%")
+    city_summary["avg_salary"] = [f"${x:,.0f}" for x in city_summary["avg_salary"].to_numpy()]
+    city_summary["remote_pct"] = [f"{x:.0f}%" for x in city_summary["remote_pct"].to_numpy()]
     n.table(city_summary, name="Employees by City")
 
     # ══════════════════════════════════════════════════════════════
@@ -14,32 +14,29 @@ Run:
 
 from __future__ import annotations
 
+import importlib.util
 import sys
 from pathlib import Path
 
 # Allow running from any location without install
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # shared example helpers
+
+from _cache_helpers import cached_figure, cached_read_csv
 
 from notebookmd import NotebookConfig, nb
 
 # Optional imports — graceful fallback
 try:
+    import numpy as np
     import pandas as pd
 
     HAS_PANDAS = True
 except ImportError:
     HAS_PANDAS = False
 
-try:
-    import matplotlib
-
-    matplotlib.use("Agg")
-    import matplotlib.dates as mdates
-    import matplotlib.pyplot as plt
-
-    HAS_MPL = True
-except ImportError:
-    HAS_MPL = False
+# matplotlib is only imported once a chart actually has to be drawn.
+HAS_MPL = importlib.util.find_spec("matplotlib") is not None
 
 HERE = Path(__file__).resolve().parent
 
@@ -72,7 +69,9 @@ def main():
 
     # ── Load Data ──
     n.section("Raw Data")
-    df = pd.read_csv(HERE / "data" / "stock_prices.csv", parse_dates=["date"])
+    df = cached_read_csv(HERE / "data" / "stock_prices.csv", parse_dates=("date",))
+    total_return = (df["close"].iloc[-1] / df["close"].iloc[0] - 1) * 100
+
     n.table(df.head(10), name="Price data (first 10 rows)")
     n.caption(f"Showing 10 of {len(df)} trading days")
 
@@ -81,7 +80,6 @@ def main():
     n.summary(df[["close", "volume", "high", "low"]], title="AAPL Trading Data Summary")
 
     price_range = df["close"].max() - df["close"].min()
-    total_return = (df["close"].iloc[-1] / df["close"].iloc[0] - 1) * 100
     avg_volume = df["volume"].mean()
 
     n.metric_row(
@@ -95,7 +93,7 @@ def main():
 
     # ── Weekly Aggregation ──
     n.section("Weekly Aggregation")
-    weekly = df.set_index("date").resample("W")["close"].agg(["mean", "min", "max", "count"]).reset_index()
+    weekly = df.groupby(pd.Grouper(key="date", freq="W"))["close"].agg(["mean", "min", "max", "count"]).reset_index()
     weekly.columns = ["week", "avg_close", "min_close", "max_close", "trading_days"]
     n.table(weekly, name="Weekly price statistics")
 
@@ -111,34 +109,56 @@ def main():
 
     # ── Charts ──
     if HAS_MPL:
+
+        def draw_price_band(plt):
+            import matplotlib.dates as mdates
+
+            fig, ax = plt.subplots(figsize=(10, 4))
+            ax.plot(df["date"], df["close"], linewidth=1.5, color="#2563eb", label="Close")
+            ax.fill_between(df["date"], df["low"], df["high"], alpha=0.15, color="#2563eb", label="High–Low range")
+            ax.set_title("AAPL Daily Close Price with High-Low Band")
+            ax.set_xlabel("Date")
+            ax.set_ylabel("Price (USD)")
+            ax.legend(loc="upper left")
+            ax.grid(True, alpha=0.3)
+            ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %d"))
+            fig.autofmt_xdate()
+            fig.tight_layout()
+            return fig
+
+        def draw_volume(plt):
+            import matplotlib.dates as mdates
+
+            fig, ax = plt.subplots(figsize=(10, 3))
+            up = df["close"].to_numpy() >= df["open"].to_numpy()
+            colors = np.where(up, "#22c55e", "#ef4444").tolist()
+            ax.bar(df["date"], df["volume"], color=colors, width=0.8)
+            ax.set_title("AAPL Daily Trading Volume")
+            ax.set_xlabel("Date")
+            ax.set_ylabel("Volume")
+            ax.grid(True, alpha=0.3, axis="y")
+            ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %d"))
+            fig.autofmt_xdate()
+            fig.tight_layout()
+            return fig
+
         n.section("Price Chart")
-        fig, ax = plt.subplots(figsize=(10, 4))
-        ax.plot(df["date"], df["close"], linewidth=1.5, color="#2563eb", label="Close")
-        ax.fill_between(df["date"], df["low"], df["high"], alpha=0.15, color="#2563eb", label="High–Low range")
-        ax.set_title("AAPL Daily Close Price with High-Low Band")
-        ax.set_xlabel("Date")
-        ax.set_ylabel("Price (USD)")
-        ax.legend(loc="upper left")
-        ax.grid(True, alpha=0.3)
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %d"))
-        fig.autofmt_xdate()
-        fig.tight_layout()
-        n.figure(fig, "aapl_price_band.png", caption="AAPL daily closing price with high-low range")
-        plt.close(fig)
+        cached_figure(
+            n,
+            "aapl_price_band.png",
+            "AAPL daily closing price with high-low range",
+            df[["date", "close", "high", "low"]],
+            draw_price_band,
+        )
 
         n.section("Volume Chart")
-        fig, ax = plt.subplots(figsize=(10, 3))
-        colors = ["#22c55e" if c >= o else "#ef4444" for c, o in zip(df["close"], df["open"], strict=True)]
-        ax.bar(df["date"], df["volume"], color=colors, width=0.8)
-        ax.set_title("AAPL Daily Trading Volume")
-        ax.set_xlabel("Date")
-        ax.set_ylabel("Volume")
-        ax.grid(True, alpha=0.3, axis="y")
-        ax.xaxis.set_major_formatter(mdates.DateFormatter("%b %d"))
-        fig.autofmt_xdate()
-        fig.tight_layout()
-        n.figure(fig, "aapl_volume.png", caption="Green = close >= open, Red = close < open")
-        plt.close(fig)
+        cached_figure(
+            n,
+            "aapl_volume.png",
+            "Green = close >= open, Red = close < open",
+            df[["date", "open", "close", "volume"]],
+            draw_volume,
+        )
 
     # ── Export ──
     n.section("Data Export")
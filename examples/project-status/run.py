@@ -14,6 +14,7 @@ Run:
 
 from __future__ import annotations
 
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -21,24 +22,21 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from notebookmd import NotebookConfig, nb
 
-try:
-    import pandas as pd
+# pandas and matplotlib are only imported once main() needs them.
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+HAS_MPL = importlib.util.find_spec("matplotlib") is not None
+
+HERE = Path(__file__).resolve().parent
 
-    HAS_PANDAS = True
-except ImportError:
-    HAS_PANDAS = False
 
-try:
+def _load_mpl():
+    """Import pyplot with the Agg backend; later calls reuse the loaded module."""
     import matplotlib
 
     matplotlib.use("Agg")
     import matplotlib.pyplot as plt
 
-    HAS_MPL = True
-except ImportError:
-    HAS_MPL = False
-
-HERE = Path(__file__).resolve().parent
+    return plt
 
 
 def main():
@@ -50,9 +48,18 @@ def main():
         n.save()
         return
 
+    import numpy as np
+    import pandas as pd
+
     # ── Load Data ──
     df = pd.read_csv(HERE / "data" / "tasks.csv")
 
+    # Status masks are reused by the overview, sprint, hours and risk sections.
+    status = df["status"].to_numpy()
+    is_completed = status == "completed"
+    is_blocked = status == "blocked"
+    is_open = is_blocked | (status == "pending")
+
     # ══════════════════════════════════════════════════════════════
     # PROJECT OVERVIEW
     # ══════════════════════════════════════════════════════════════
@@ -61,9 +68,9 @@ def main():
     n.badge("IN PROGRESS", style="warning")
 
     total_tasks = len(df)
-    completed = len(df[df["status"] == "completed"])
-    in_progress = len(df[df["status"] == "in_progress"])
-    blocked = len(df[df["status"] == "blocked"])
+    completed = int(is_completed.sum())
+    in_progress = int((status == "in_progress").sum())
+    blocked = int(is_blocked.sum())
     completion_pct = completed / total_tasks
 
     n.metric_row(
@@ -82,9 +89,9 @@ def main():
     # ══════════════════════════════════════════════════════════════
     n.section("Sprint Breakdown")
 
-    for sprint in df["sprint"].unique():
-        sprint_df = df[df["sprint"] == sprint]
-        sprint_done = len(sprint_df[sprint_df["status"] == "completed"])
+    # sort=False keeps the sprints in the order they first appear in the data
+    for sprint, sprint_df in df.assign(is_completed=is_completed).groupby("sprint", sort=False):
+        sprint_done = int(sprint_df["is_completed"].sum())
         sprint_total = len(sprint_df)
         pct = sprint_done / sprint_total if sprint_total > 0 else 0
 
@@ -119,6 +126,7 @@ def main():
     )
 
     if HAS_MPL:
+        plt = _load_mpl()
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
 
         # Status pie
@@ -148,39 +156,36 @@ def main():
     n.section("Team Workload")
 
     team = (
-        df.groupby("assignee")
+        df.assign(is_completed=is_completed)
+        .groupby("assignee")
         .agg(
             tasks=("task_id", "count"),
-            completed=("status", lambda x: (x == "completed").sum()),
+            completed=("is_completed", "sum"),
             estimated=("estimate_hours", "sum"),
             actual=("actual_hours", "sum"),
         )
         .reset_index()
     )
-    team["completion"] = (team["completed"] / team["tasks"] * 100).round(0).astype(int)
+    team["completion"] = np.rint(team["completed"].to_numpy() / team["tasks"].to_numpy() * 100).astype(int)
     team = team.sort_values("tasks", ascending=False)
     n.table(team, name="Workload by Team Member")
 
+    members = team["assignee"].tolist()
+    actual = team["actual"].to_numpy()
+    estimated = team["estimated"].to_numpy()
+
     # Highlight over/under estimates
     with n.expander("Estimation Accuracy", expanded=True):
-        for _, row in team.iterrows():
-            if row["actual"] > 0:
-                ratio = row["actual"] / row["estimated"] if row["estimated"] > 0 else 0
-                if ratio > 1.1:
-                    n.warning(
-                        f"**{row['assignee']}**: {row['actual']}h actual vs {row['estimated']}h estimated "
-                        f"({ratio:.0%} — over estimate)"
-                    )
-                elif ratio < 0.9:
-                    n.success(
-                        f"**{row['assignee']}**: {row['actual']}h actual vs {row['estimated']}h estimated "
-                        f"({ratio:.0%} — under estimate)"
-                    )
-                else:
-                    n.info(
-                        f"**{row['assignee']}**: {row['actual']}h actual vs {row['estimated']}h estimated "
-                        f"({ratio:.0%} — on target)"
-                    )
+        ratios = np.divide(actual, estimated, out=np.zeros(len(team)), where=estimated > 0)
+        for i in np.flatnonzero(actual > 0):
+            ratio = ratios[i]
+            summary = f"**{members[i]}**: {actual[i]}h actual vs {estimated[i]}h estimated ({ratio:.0%} — "
+            if ratio > 1.1:
+                n.warning(summary + "over estimate)")
+            elif ratio < 0.9:
+                n.success(summary + "under estimate)")
+            else:
+                n.info(summary + "on target)")
 
     # ══════════════════════════════════════════════════════════════
     # HOURS TRACKING
@@ -189,7 +194,7 @@ def main():
 
     total_estimated = df["estimate_hours"].sum()
     total_actual = df["actual_hours"].sum()
-    remaining_est = df[df["status"].isin(["pending", "blocked"])]["estimate_hours"].sum()
+    remaining_est = df["estimate_hours"].to_numpy()[is_open].sum()
 
     n.metric_row(
         [
@@ -202,13 +207,13 @@ def main():
     n.change("Hours Burned", total_actual, total_estimated, fmt=".0f", pct=True)
 
     if HAS_MPL:
+        plt = _load_mpl()
         fig, ax = plt.subplots(figsize=(8, 4))
-        members = team["assignee"].tolist()
-        x_pos = range(len(members))
+        x_pos = np.arange(len(members))
         width = 0.35
-        ax.bar([x - width / 2 for x in x_pos], team["estimated"], width, label="Estimated", color="#94a3b8")
-        ax.bar([x + width / 2 for x in x_pos], team["actual"], width, label="Actual", color="#2563eb")
-        ax.set_xticks(list(x_pos))
+        ax.bar(x_pos - width / 2, estimated, width, label="Estimated", color="#94a3b8")
+        ax.bar(x_pos + width / 2, actual, width, label="Actual", color="#2563eb")
+        ax.set_xticks(x_pos)
         ax.set_xticklabels(members, rotation=30, ha="right")
         ax.set_ylabel("Hours")
         ax.set_title("Estimated vs Actual Hours by Team Member")
@@ -223,14 +228,14 @@ def main():
     # ══════════════════════════════════════════════════════════════
     n.section("Risks & Blockers")
 
-    blocked_tasks = df[df["status"] == "blocked"]
+    blocked_tasks = df[is_blocked]
     if len(blocked_tasks) > 0:
         for _, task in blocked_tasks.iterrows():
             n.error(f"**BLOCKED** — {task['task_id']}: {task['title']} (assigned to {task['assignee']})")
     else:
         n.success("No blocked tasks.")
 
-    high_prio_pending = df[(df["priority"] == "high") & (df["status"].isin(["pending", "blocked"]))]
+    high_prio_pending = df[(df["priority"].to_numpy() == "high") & is_open]
     if len(high_prio_pending) > 0:
         n.warning(f"{len(high_prio_pending)} high-priority tasks are not yet started or blocked:")
         n.table(
@@ -14,6 +14,7 @@ Run:
 
 from __future__ import annotations
 
+import importlib.util
 import sys
 from pathlib import Path
 
@@ -21,24 +22,26 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 from notebookmd import NotebookConfig, nb
 
-try:
-    import pandas as pd
+# pandas and matplotlib are only imported once main() needs them.
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+HAS_MPL = importlib.util.find_spec("matplotlib") is not None
+
+HERE = Path(__file__).resolve().parent
 
-    HAS_PANDAS = True
-except ImportError:
-    HAS_PANDAS = False
 
-try:
+def _load_mpl():
+    """Import pyplot with the Agg backend; later calls reuse the loaded module."""
     import matplotlib
 
     matplotlib.use("Agg")
     import matplotlib.pyplot as plt
 
-    HAS_MPL = True
-except ImportError:
-    HAS_MPL = False
+    return plt
 
-HERE = Path(__file__).resolve().parent
+
+def _margin_pct(frame):
+    """Profit margin of each row of an aggregated frame, in percent rounded to 0.1."""
+    return (frame["profit"].to_numpy() / frame["revenue"].to_numpy() * 100).round(1)
 
 
 def main():
@@ -50,10 +53,16 @@ def main():
         n.save()
         return
 
+    import pandas as pd
+
     # ── Load Data ──
     df = pd.read_csv(HERE / "data" / "sales.csv", parse_dates=["date"])
-    df["profit"] = df["revenue"] - df["cost"]
-    df["margin"] = df["profit"] / df["revenue"]
+    # Derived once on the raw arrays; the columns are kept for the groupbys and the CSV export.
+    revenue = df["revenue"].to_numpy()
+    profit = revenue - df["cost"].to_numpy()
+    margin = profit / revenue
+    df["profit"] = profit
+    df["margin"] = margin
 
     # ══════════════════════════════════════════════════════════════
     # EXECUTIVE SUMMARY
@@ -62,10 +71,10 @@ def main():
     n.badge("LIVE", style="success")
     n.write("Monthly performance overview for all regions and products.")
 
-    total_revenue = df["revenue"].sum()
-    total_profit = df["profit"].sum()
+    total_revenue = revenue.sum()
+    total_profit = profit.sum()
     total_units = df["units"].sum()
-    avg_margin = df["margin"].mean()
+    avg_margin = margin.mean()
 
     n.metric_row(
         [
@@ -76,10 +85,16 @@ def main():
         ]
     )
 
+    # Weekly totals, shared with the Weekly Trends section
+    weekly = (
+        df.groupby("date")
+        .agg(revenue=("revenue", "sum"), units=("units", "sum"), profit=("profit", "sum"))
+        .reset_index()
+    )
+
     # Week-over-week change (last week vs first week)
-    weekly_rev = df.groupby("date")["revenue"].sum().reset_index()
-    first_week_rev = weekly_rev.iloc[0]["revenue"]
-    last_week_rev = weekly_rev.iloc[-1]["revenue"]
+    first_week_rev = weekly["revenue"].iat[0]
+    last_week_rev = weekly["revenue"].iat[-1]
     n.change("Weekly Revenue", last_week_rev, first_week_rev, fmt=",.0f", pct=True)
 
     # ══════════════════════════════════════════════════════════════
@@ -93,28 +108,24 @@ def main():
         .sort_values("revenue", ascending=False)
         .reset_index()
     )
-    region_summary["margin"] = (region_summary["profit"] / region_summary["revenue"] * 100).round(1)
+    region_summary["margin"] = _margin_pct(region_summary)
     n.table(region_summary, name="Revenue by Region")
 
     # Rank the regions
-    for i, row in region_summary.iterrows():
-        n.ranking(
-            row["region"],
-            row["revenue"],
-            rank=i + 1,
-            total=len(region_summary),
-            fmt=",.0f",
-        )
+    regions = zip(region_summary["region"].tolist(), region_summary["revenue"].tolist(), strict=True)
+    for rank, (region, region_revenue) in enumerate(regions, start=1):
+        n.ranking(region, region_revenue, rank=rank, total=len(region_summary), fmt=",.0f")
 
     if HAS_MPL:
+        plt = _load_mpl()
         fig, ax = plt.subplots(figsize=(8, 4))
-        ax.barh(region_summary["region"], region_summary["revenue"], color=["#2563eb", "#7c3aed", "#059669", "#dc2626"])
+        bars = ax.barh(
+            region_summary["region"], region_summary["revenue"], color=["#2563eb", "#7c3aed", "#059669", "#dc2626"]
+        )
         ax.set_xlabel("Revenue ($)")
         ax.set_title("Revenue by Region")
         ax.grid(True, alpha=0.3, axis="x")
-        for i, v in enumerate(region_summary["revenue"]):
-            ax.text(v + 1000, i, f"${v:,.0f}", va="center", fontsize=9)
-        fig.tight_layout()
+        ax.bar_label(bars, fmt="${:,.0f}", padding=3, fontsize=9)
         n.figure(fig, "revenue_by_region.png", caption="Regional revenue comparison")
         plt.close(fig)
 
@@ -125,55 +136,37 @@ def main():
 
     tabs = n.tabs(["Widget A", "Widget B", "Comparison"])
 
-    product_a = df[df["product"] == "Widget A"]
-    product_b = df[df["product"] == "Widget B"]
-
-    with tabs.tab("Widget A"):
-        a_rev = product_a["revenue"].sum()
-        a_units = product_a["units"].sum()
-        a_margin = product_a["margin"].mean()
-        n.metric_row(
-            [
-                {"label": "Revenue", "value": f"${a_rev:,.0f}"},
-                {"label": "Units", "value": f"{a_units:,}"},
-                {"label": "Avg Margin", "value": f"{a_margin:.1%}"},
-            ]
-        )
+    # One pass over the products feeds the per-product tabs and the comparison table
+    by_product = df.groupby("product").agg(
+        revenue=("revenue", "sum"),
+        units=("units", "sum"),
+        profit=("profit", "sum"),
+        avg_margin=("margin", "mean"),
+    )
 
-    with tabs.tab("Widget B"):
-        b_rev = product_b["revenue"].sum()
-        b_units = product_b["units"].sum()
-        b_margin = product_b["margin"].mean()
-        n.metric_row(
-            [
-                {"label": "Revenue", "value": f"${b_rev:,.0f}"},
-                {"label": "Units", "value": f"{b_units:,}"},
-                {"label": "Avg Margin", "value": f"{b_margin:.1%}"},
-            ]
-        )
+    for product in ("Widget A", "Widget B"):
+        with tabs.tab(product):
+            n.metric_row(
+                [
+                    {"label": "Revenue", "value": f"${by_product.at[product, 'revenue']:,.0f}"},
+                    {"label": "Units", "value": f"{by_product.at[product, 'units']:,}"},
+                    {"label": "Avg Margin", "value": f"{by_product.at[product, 'avg_margin']:.1%}"},
+                ]
+            )
 
     with tabs.tab("Comparison"):
-        comparison = (
-            df.groupby("product")
-            .agg(revenue=("revenue", "sum"), units=("units", "sum"), profit=("profit", "sum"))
-            .reset_index()
-        )
-        comparison["margin"] = (comparison["profit"] / comparison["revenue"] * 100).round(1)
+        comparison = by_product.drop(columns="avg_margin").reset_index()
+        comparison["margin"] = _margin_pct(comparison)
         n.table(comparison, name="Product Comparison")
 
     # ══════════════════════════════════════════════════════════════
     # WEEKLY TRENDS
     # ══════════════════════════════════════════════════════════════
     n.section("Weekly Trends")
-
-    weekly = (
-        df.groupby("date")
-        .agg(revenue=("revenue", "sum"), units=("units", "sum"), profit=("profit", "sum"))
-        .reset_index()
-    )
     n.table(weekly, name="Weekly totals")
 
     if HAS_MPL:
+        plt = _load_mpl()
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 6), sharex=True)
 
         ax1.plot(weekly["date"], weekly["revenue"], marker="o", color="#2563eb", linewidth=2)
@@ -186,7 +179,9 @@ def main():
         ax2.set_xlabel("Week")
         ax2.grid(True, alpha=0.3, axis="y")
 
-        fig.tight_layout()
+        # Only the gap between the panels needs setting; savefig(bbox_inches="tight")
+        # already trims the outer margins, so tight_layout's solver is not needed.
+        fig.subplots_adjust(hspace=0.1)
         n.figure(fig, "weekly_trends.png", caption="Revenue and unit trends over 5 weeks")
         plt.close(fig)
 
@@ -198,9 +193,7 @@ def main():
     margin_by_region_product = (
         df.groupby(["region", "product"]).agg(revenue=("revenue", "sum"), profit=("profit", "sum")).reset_index()
     )
-    margin_by_region_product["margin"] = (
-        margin_by_region_product["profit"] / margin_by_region_product["revenue"] * 100
-    ).round(1)
+    margin_by_region_product["margin"] = _margin_pct(margin_by_region_product)
     n.table(margin_by_region_product, name="Margin by Region × Product")
 
     best = margin_by_region_product.loc[margin_by_region_product["margin"].idxmax()]
@@ -26,6 +26,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 from notebookmd import NotebookConfig, nb
 
 try:
+    import numpy as np
     import pandas as pd
 
     HAS_PANDAS = True
@@ -233,12 +234,13 @@ def main():
     # ══════════════════════════════════════════════════════════════
     if HAS_PANDAS:
         n.section("DataFrame Display")
+        i = np.arange(20)
         df = pd.DataFrame(
             {
                 "date": pd.date_range("2026-01-01", periods=20, freq="D"),
-                "close": [95 + i * 0.5 + (i % 7) * 0.3 for i in range(20)],
-                "volume": [1_000_000 + i * 50_000 for i in range(20)],
-                "rsi": [45 + i * 0.8 - (i % 5) * 2 for i in range(20)],
+                "close": 95 + i * 0.5 + (i % 7) * 0.3,
+                "volume": 1_000_000 + i * 50_000,
+                "rsi": 45 + i * 0.8 - (i % 5) * 2,
             }
         )
         n.dataframe(df, name="Sample Trading Data")
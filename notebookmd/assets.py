@@ -7,6 +7,17 @@ from pathlib import Path
 from typing import Any
 
 
+def _png_save_kwargs(filename: str, compress_level: int | None) -> dict[str, Any]:
+    """Extra ``savefig`` keyword arguments for a PNG zlib compression level.
+
+    Returns an empty dict when no level is set or the file is not a PNG, so
+    matplotlib's defaults apply.
+    """
+    if compress_level is None or not filename.lower().endswith(".png"):
+        return {}
+    return {"pil_kwargs": {"compress_level": compress_level}}
+
+
 class AssetManager:
     """Manages saved artifacts (images, CSVs) and generates the artifact index section."""
 
@@ -18,11 +29,18 @@ class AssetManager:
         """
         self.assets_dir = assets_dir
         self.base_dir = base_dir
-        self._artifacts: list[str] = []  # relative paths
+        self._artifacts: dict[str, None] = {}  # relative paths, in registration order
+        self._dir_ready = False
 
     def ensure_dir(self) -> None:
-        """Create the assets directory if it doesn't exist."""
+        """Create the assets directory if it doesn't exist.
+
+        Only the first call touches the filesystem; later calls return immediately.
+        """
+        if self._dir_ready:
+            return
         self.assets_dir.mkdir(parents=True, exist_ok=True)
+        self._dir_ready = True
 
     def rel_path(self, absolute: Path) -> str:
         """Get the path of an asset relative to the markdown output directory."""
@@ -30,20 +48,24 @@ class AssetManager:
 
     def register(self, rel: str) -> None:
         """Register an artifact by its relative path (deduplicates)."""
-        if rel not in self._artifacts:
-            self._artifacts.append(rel)
+        self._artifacts.setdefault(rel, None)
 
     @property
     def artifacts(self) -> list[str]:
         return list(self._artifacts)
 
-    def save_figure(self, fig: Any, filename: str, dpi: int = 160) -> str:
+    def save_figure(
+        self, fig: Any, filename: str, dpi: int = 160, compress_level: int | None = None, tight: bool = True
+    ) -> str:
         """Save a matplotlib figure to the assets directory.
 
         Args:
             fig: A matplotlib Figure object.
             filename: Output filename (e.g. "daily_volume.png").
             dpi: Resolution for the saved image.
+            compress_level: zlib level (0-9) for PNG output; ``None`` keeps matplotlib's default.
+            tight: Crop the image to the figure's content (``bbox_inches="tight"``).
+                ``False`` saves the full canvas, skipping an extra draw pass.
 
         Returns:
             Relative path to the saved figure.
@@ -57,7 +79,9 @@ class AssetManager:
 
         self.ensure_dir()
         out_file = self.assets_dir / filename
-        fig.savefig(out_file, dpi=dpi, bbox_inches="tight")
+        fig.savefig(
+            out_file, dpi=dpi, bbox_inches="tight" if tight else None, **_png_save_kwargs(filename, compress_level)
+        )
         plt.close(fig)
 
         rel = self.rel_path(out_file)
@@ -82,6 +106,26 @@ class AssetManager:
         self.register(rel)
         return rel
 
+    def save_parquet(self, df: Any, filename: str) -> str:
+        """Save a DataFrame as Snappy-compressed Parquet to the assets directory.
+
+        Requires a Parquet engine for pandas (pyarrow or fastparquet).
+
+        Args:
+            df: A pandas DataFrame.
+            filename: Output filename (e.g. "aggregated.parquet").
+
+        Returns:
+            Relative path to the saved Parquet file.
+        """
+        self.ensure_dir()
+        out_file = self.assets_dir / filename
+        df.to_parquet(out_file, index=False, compression="snappy")
+
+        rel = self.rel_path(out_file)
+        self.register(rel)
+        return rel
+
     def save_plotly(self, fig: Any, filename: str) -> str:
         """Save a Plotly figure to the assets directory.
 
@@ -201,11 +245,32 @@ class AssetManager:
         Returns:
             Relative path to the saved JSON file.
         """
-        import json
+        from .widgets import _dumps_json
+
+        self.ensure_dir()
+        out_file = self.assets_dir / filename
+        out_file.write_text(_dumps_json(data, indent=2))
+
+        rel = self.rel_path(out_file)
+        self.register(rel)
+        return rel
+
+    def copy_file(self, source: str | Path, filename: str) -> str:
+        """Copy an existing file (e.g. a pre-rendered image) into the assets directory.
+
+        Args:
+            source: Path to the file to copy.
+            filename: Output filename inside the assets directory.
+
+        Returns:
+            Relative path to the copied file.
+        """
+        import shutil
 
         self.ensure_dir()
         out_file = self.assets_dir / filename
-        out_file.write_text(json.dumps(data, indent=2, ensure_ascii=False, default=str))
+        if Path(source).resolve() != out_file.resolve():
+            shutil.copyfile(source, out_file)
 
         rel = self.rel_path(out_file)
         self.register(rel)
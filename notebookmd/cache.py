@@ -30,6 +30,7 @@ import os
 import pickle
 import threading
 import time
+import types
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
@@ -83,51 +84,79 @@ class CacheEntry:
 # ---------------------------------------------------------------------------
 
 
-def _make_key(func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
-    """Build a deterministic cache key from function identity + call arguments."""
+def _make_key(func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any], sample: bool = True) -> str:
+    """Build a deterministic cache key from function identity + call arguments.
+
+    ``sample`` is passed on to ``_hash_arg``; set it to False to hash every
+    row of large DataFrames.
+    """
     parts: list[str] = [func.__module__, func.__qualname__]
 
     for arg in args:
-        parts.append(_hash_arg(arg))
+        parts.append(_hash_arg(arg, sample))
     for k in sorted(kwargs):
-        parts.append(f"{k}={_hash_arg(kwargs[k])}")
+        parts.append(f"{k}={_hash_arg(kwargs[k], sample)}")
 
     raw = ":".join(parts)
     return hashlib.sha256(raw.encode()).hexdigest()
 
 
-def _hash_arg(obj: Any) -> str:
-    """Produce a stable string representation for a single argument."""
+def _code_fingerprint(code: types.CodeType) -> bytes:
+    """Bytes identifying a function body: its bytecode, names and constants, nested functions included.
+
+    Line numbers are not part of it, so moving a function does not change its fingerprint.
+    """
+    parts = [code.co_code, repr(code.co_names).encode()]
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            parts.append(_code_fingerprint(const))
+        elif isinstance(const, frozenset):
+            # Set iteration order depends on string hash randomization.
+            parts.append(repr(sorted(map(repr, const))).encode())
+        else:
+            parts.append(repr(const).encode())
+    return b"\0".join(parts)
+
+
+def _hash_arg(obj: Any, sample: bool = True) -> str:
+    """Produce a stable string representation for a single argument.
+
+    DataFrames over 1000 rows are hashed from their first and last 500 rows
+    unless ``sample`` is False.
+    """
     # Fast path for common immutable types
     if isinstance(obj, (str, int, float, bool, type(None))):
         return repr(obj)
     if isinstance(obj, (bytes, bytearray)):
         return hashlib.md5(obj).hexdigest()
     if isinstance(obj, (list, tuple)):
-        return "[" + ",".join(_hash_arg(v) for v in obj) + "]"
+        return "[" + ",".join(_hash_arg(v, sample) for v in obj) + "]"
     if isinstance(obj, dict):
-        items = sorted((k, _hash_arg(v)) for k, v in obj.items())
+        items = sorted((k, _hash_arg(v, sample)) for k, v in obj.items())
         return "{" + ",".join(f"{k}:{v}" for k, v in items) + "}"
     if isinstance(obj, (set, frozenset)):
-        return "{" + ",".join(sorted(_hash_arg(v) for v in obj)) + "}"
+        return "{" + ",".join(sorted(_hash_arg(v, sample) for v in obj)) + "}"
 
     # pandas DataFrame / Series
     try:
         import pandas as pd
 
+        # Hash cell values with hash_pandas_object: raw ``.values`` bytes of
+        # object/string columns are pointers and differ between processes.
         if isinstance(obj, pd.DataFrame):
             h = hashlib.md5()
             h.update(pickle.dumps(obj.shape))
             h.update(pickle.dumps(list(obj.columns)))
             # Use a sample for large DataFrames to keep hashing fast
-            if len(obj) > 1000:
-                h.update(pickle.dumps(obj.head(500).values.tobytes()))
-                h.update(pickle.dumps(obj.tail(500).values.tobytes()))
+            if sample and len(obj) > 1000:
+                h.update(pd.util.hash_pandas_object(obj.head(500), index=False).to_numpy().tobytes())
+                h.update(pd.util.hash_pandas_object(obj.tail(500), index=False).to_numpy().tobytes())
             else:
-                h.update(obj.values.tobytes())
+                h.update(pd.util.hash_pandas_object(obj, index=False).to_numpy().tobytes())
             return f"df:{h.hexdigest()}"
         if isinstance(obj, pd.Series):
-            return f"series:{hashlib.md5(obj.to_numpy().tobytes()).hexdigest()}"
+            digest = hashlib.md5(pd.util.hash_pandas_object(obj, index=False).to_numpy().tobytes())
+            return f"series:{digest.hexdigest()}"
     except (ImportError, Exception):
         pass
 
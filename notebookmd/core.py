@@ -8,27 +8,103 @@ can add new methods via entry points or ``Notebook.use()``.
 
 from __future__ import annotations
 
+import hashlib
+import multiprocessing
+import os
+import re
 import types
+import weakref
 from collections.abc import Callable, Generator, Sequence
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TextIO
 
-from .assets import AssetManager
+from .assets import AssetManager, _png_save_kwargs
 from .widgets import render_column_separator, render_columns_end, render_tab_end, render_tab_start
 
 if TYPE_CHECKING:
     from .plugins import PluginSpec
 
 
+_ARTIFACTS_PLACEHOLDER = "{{ARTIFACTS_PLACEHOLDER}}"
+
+# The only line of a report that changes between otherwise identical runs.
+_GENERATED_RE = re.compile(r"^_Generated: .*_$", re.MULTILINE)
+
+
+def _content_digest(markdown: str) -> str:
+    """Hash report markdown, ignoring the ``_Generated: ..._`` timestamp line."""
+    stable = _GENERATED_RE.sub("", markdown, count=1)
+    return hashlib.sha256(stable.encode("utf-8")).hexdigest()
+
+
+def _discard_partial(stream: TextIO, partial: Path) -> None:
+    """Close and delete a streamed report that was never finished by ``save()``."""
+    stream.close()
+    partial.unlink(missing_ok=True)
+
+
+def _draw_mpl_chart(
+    chart_type: str,
+    data: Any,
+    x: str | None,
+    y_cols: list[str],
+    title: str,
+    x_label: str,
+    y_label: str,
+    out_file: str,
+    compress_level: int | None = None,
+    tight: bool = True,
+) -> None:
+    """Draw a matplotlib chart and save it as a PNG.
+
+    Kept at module level so deferred charts can be drawn in worker processes.
+    """
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(10, 4))
+    x_data = data[x] if x else data.index
+
+    for col in y_cols:
+        if chart_type == "line":
+            ax.plot(x_data, data[col], label=col, linewidth=1.5)
+        elif chart_type == "area":
+            ax.fill_between(x_data, data[col], alpha=0.4, label=col)
+            ax.plot(x_data, data[col], linewidth=1.0)
+        elif chart_type == "bar":
+            ax.bar(range(len(data[col])), data[col], label=col, alpha=0.7)
+        elif chart_type == "barh":
+            ax.barh(range(len(data[col])), data[col], label=col, alpha=0.7)
+
+    if title:
+        ax.set_title(title)
+    if x_label:
+        ax.set_xlabel(x_label)
+    if y_label:
+        ax.set_ylabel(y_label)
+    if len(y_cols) > 1:
+        ax.legend()
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+    fig.savefig(out_file, dpi=160, bbox_inches="tight" if tight else None, **_png_save_kwargs(out_file, compress_level))
+    plt.close(fig)
+
+
 @dataclass
 class NotebookConfig:
     """Configuration for report rendering behavior."""
 
     max_table_rows: int = 30
     float_format: str = "{:.4f}"
+    defer_charts: bool = False  # Draw matplotlib charts in parallel at render time
+    streaming: bool = False  # Write chunks straight to disk instead of buffering the report
+    png_compress_level: int | None = None  # zlib level for saved PNGs; 1 encodes faster, None keeps matplotlib's 6
+    tight_bbox: bool = True  # Crop saved charts to their content; False skips an extra draw pass per chart
 
 
 class Notebook:
@@ -84,7 +160,11 @@ class Notebook:
         self._asset_mgr = AssetManager(self.assets_path, self.out_path.parent)
         self._started = False
         self._counter = 0  # General-purpose counter for unique filenames
-        self._chunks: list[str] = []
+        self._chunks: list[str] = []  # Markdown fragments, joined once on render
+        self._artifacts_slot = -1  # Index of the artifacts placeholder in _chunks
+        self._pending_charts: list[tuple[Any, ...]] = []  # Deferred matplotlib chart jobs
+        self._stream: TextIO | None = None  # Partial output file in streaming mode
+        self._stream_cleanup: weakref.finalize | None = None  # Deletes an unfinished partial file
         self._plugins: dict[str, Any] = {}  # name -> PluginSpec instance
         self._on_write: Callable[[str], None] | None = None  # Live output callback
 
@@ -147,8 +227,15 @@ class Notebook:
         return dict(self._plugins)
 
     def _w(self, s: str) -> None:
-        """Append a chunk of markdown to the internal buffer."""
-        self._chunks.append(s)
+        """Append a chunk of markdown to the internal buffer (or the streamed file)."""
+        if self.cfg.streaming and self._stream is None:
+            self._open_stream()
+        if self._stream is not None:
+            if self._stream.closed:
+                raise RuntimeError("this streaming report was already saved; create a new Notebook to write more")
+            self._stream.write(s)
+        else:
+            self._chunks.append(s)
         if self._on_write is not None:
             self._on_write(s)
 
@@ -162,8 +249,11 @@ class Notebook:
 
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self._w(f"# {self._title}\n\n_Generated: {now}_\n\n")
+        if self._stream is not None:
+            return
         self._w("## Artifacts\n\n")
-        self._w("{{ARTIFACTS_PLACEHOLDER}}\n\n---\n\n")
+        self._artifacts_slot = len(self._chunks)
+        self._w(f"{_ARTIFACTS_PLACEHOLDER}\n\n---\n\n")
 
     def _next_id(self) -> int:
         """Return an auto-incrementing counter for unique asset filenames."""
@@ -199,6 +289,74 @@ class Notebook:
             self._w(f"_{description}_\n\n")
         return _SectionContext(self)
 
+    def cached_block(self, emit: Callable[[], None], *inputs: Any) -> bool:
+        """Run ``emit`` to write part of the report, or replay its cached output.
+
+        The markdown written by ``emit`` and the artifacts it registers are
+        stored in the ``cache_data`` store, keyed by ``emit``'s qualified name
+        and code, this report's path, its ``NotebookConfig``, the notebookmd
+        version and ``inputs`` (hashed like ``cache_data`` arguments, but with
+        every DataFrame row). A later run with the same key writes the stored
+        markdown instead of calling ``emit``, as long as its artifact files
+        still exist::
+
+            def department_analysis():
+                n.section("Department Analysis")
+                n.table(summarize(df), name="Departments")
+
+            n.cached_block(department_analysis, df)
+
+        Pass everything ``emit`` reads as ``inputs``. Editing ``emit`` itself
+        invalidates the entry, but editing a function it calls (``summarize``
+        above) does not; clear the cache (``notebookmd cache clear``) then.
+
+        Returns:
+            True if the output was replayed from the cache, False if ``emit`` ran.
+        """
+        from . import __version__
+        from .cache import _SENTINEL, _code_fingerprint, _make_key, get_cache_manager
+
+        self._ensure_started()
+        mgr = get_cache_manager()
+        # Output rendered by other code, under other settings or by another release must
+        # not be replayed, and a change anywhere in a large frame must be noticed.
+        code = getattr(emit, "__code__", None)
+        fingerprint = _code_fingerprint(code) if code is not None else b""
+        context = (str(self.out_path.resolve()), __version__, asdict(self.cfg), fingerprint)
+        key = _make_key(emit, (*context, *inputs), {}, sample=False)
+
+        cached = mgr.get_data(key)
+        if cached is not _SENTINEL:
+            markdown, artifacts, ids_used = cached
+            if all((self._asset_mgr.base_dir / rel).exists() for rel in artifacts):
+                self._w(markdown)
+                for rel in artifacts:
+                    self._asset_mgr.register(rel)
+                self._counter += ids_used  # keep later auto-generated filenames stable
+                return True
+
+        # Record everything ``emit`` writes by chaining onto the live-output hook,
+        # which sees each chunk in both buffered and streaming mode.
+        captured: list[str] = []
+        on_write = self._on_write
+
+        def record(s: str) -> None:
+            captured.append(s)
+            if on_write is not None:
+                on_write(s)
+
+        n_artifacts = len(self._asset_mgr.artifacts)
+        first_id = self._counter
+        self._on_write = record
+        try:
+            emit()
+        finally:
+            self._on_write = on_write
+
+        artifacts = self._asset_mgr.artifacts[n_artifacts:]
+        mgr.put_data(key, ("".join(captured), artifacts, self._counter - first_id))
+        return False
+
     # ── Internal chart helpers ──
 
     def _try_render_mpl_chart(
@@ -212,12 +370,13 @@ class Notebook:
         y_label: str,
         filename: str | None,
     ) -> str | None:
-        """Try to render a chart using matplotlib. Returns relative path or None."""
-        try:
-            import matplotlib
+        """Try to render a chart using matplotlib. Returns relative path or None.
 
-            matplotlib.use("Agg")
-            import matplotlib.pyplot as plt
+        With ``cfg.defer_charts`` the chart is only queued here and drawn when
+        the report is rendered; the returned path is final either way.
+        """
+        try:
+            import matplotlib  # noqa: F401
             import pandas as pd
         except ImportError:
             return None
@@ -228,8 +387,6 @@ class Notebook:
             except Exception:
                 return None
 
-        fig, ax = plt.subplots(figsize=(10, 4))
-
         y_cols: list[str] = []
         if y is None:
             y_cols = data.select_dtypes(include="number").columns.tolist()
@@ -238,59 +395,146 @@ class Notebook:
         else:
             y_cols = list(y)
 
-        x_data = data[x] if x else data.index
-
-        for col in y_cols:
-            if chart_type == "line":
-                ax.plot(x_data, data[col], label=col, linewidth=1.5)
-            elif chart_type == "area":
-                ax.fill_between(x_data, data[col], alpha=0.4, label=col)
-                ax.plot(x_data, data[col], linewidth=1.0)
-            elif chart_type == "bar":
-                ax.bar(range(len(data[col])), data[col], label=col, alpha=0.7)
-            elif chart_type == "barh":
-                ax.barh(range(len(data[col])), data[col], label=col, alpha=0.7)
-
-        if title:
-            ax.set_title(title)
-        if x_label:
-            ax.set_xlabel(x_label)
-        if y_label:
-            ax.set_ylabel(y_label)
-        if len(y_cols) > 1:
-            ax.legend()
-        ax.grid(True, alpha=0.3)
-        fig.tight_layout()
-
         fname = filename or f"{chart_type}_{self._next_id()}.png"
-        rel = self._asset_mgr.save_figure(fig, fname, dpi=160)
+        self._asset_mgr.ensure_dir()
+        out_file = self._asset_mgr.assets_dir / fname
+        if self.cfg.defer_charts:
+            # Snapshot the plotted columns so the chart shows the data as of this
+            # call even if the caller mutates the frame before the report is saved.
+            data = data[list(dict.fromkeys([x, *y_cols] if x else y_cols))].copy()
+        job = (
+            chart_type,
+            data,
+            x,
+            y_cols,
+            title,
+            x_label,
+            y_label,
+            str(out_file),
+            self.cfg.png_compress_level,
+            self.cfg.tight_bbox,
+        )
+        if self.cfg.defer_charts:
+            self._pending_charts.append(job)
+        else:
+            _draw_mpl_chart(*job)
+
+        rel = self._asset_mgr.rel_path(out_file)
+        self._asset_mgr.register(rel)
         return rel
 
+    def _flush_charts(self) -> None:
+        """Draw all deferred charts, in parallel worker processes when there are several.
+
+        Workers are only used with the ``fork`` start method: ``spawn`` and
+        ``forkserver`` workers re-import ``__main__``, which would re-run a
+        top-level report script. Otherwise the charts are drawn in-process.
+        """
+        pending, self._pending_charts = self._pending_charts, []
+        # allow_none keeps this from fixing the process-wide start method; when none
+        # is set, the platform default is listed first.
+        method = multiprocessing.get_start_method(allow_none=True) or multiprocessing.get_all_start_methods()[0]
+        if len(pending) > 1 and method == "fork":
+            from concurrent.futures import ProcessPoolExecutor
+
+            workers = min(len(pending), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as pool:
+                for future in [pool.submit(_draw_mpl_chart, *job) for job in pending]:
+                    future.result()
+        else:
+            for job in pending:
+                _draw_mpl_chart(*job)
+
     # ── Save / render ──
 
-    def save(self) -> Path:
+    def save(self, skip_unchanged: bool = False) -> Path:
         """Write the report markdown to disk.
 
+        Args:
+            skip_unchanged: If True and the existing output file has the same
+                content (ignoring the generation timestamp), leave it untouched
+                so its timestamp and mtime stay stable across re-runs.
+
+        In streaming mode this finishes the report: the artifacts index is
+        appended and the partial file is moved into place, after which no
+        more content can be written.
+
         Returns:
             Path to the saved markdown file.
         """
-        self._ensure_started()
+        if self.cfg.streaming:
+            return self._finish_stream(skip_unchanged)
+
+        content = self._render()
+
+        if skip_unchanged and self._is_unchanged(content):
+            return self.out_path
 
-        content = "".join(self._chunks)
+        # Encode once and write raw bytes, skipping the buffered text layer.
+        self.out_path.write_bytes(content.encode("utf-8"))
+        return self.out_path
+
+    def _is_unchanged(self, content: str) -> bool:
+        """Return True if the file on disk already holds ``content``."""
+        try:
+            existing = self.out_path.read_text(encoding="utf-8")
+        except OSError:
+            return False
+        return _content_digest(existing) == _content_digest(content)
 
-        # Replace the artifacts placeholder with the actual index
-        artifact_index = self._asset_mgr.render_index()
-        content = content.replace("{{ARTIFACTS_PLACEHOLDER}}", artifact_index)
+    def _open_stream(self) -> None:
+        """Open the partial output file that streaming mode writes every chunk to.
 
-        self.out_path.write_text(content, encoding="utf-8")
+        Nothing is kept in memory; the artifacts index is appended by ``save()``.
+        If the report is never saved (e.g. the script raises), the partial file
+        is deleted when the Notebook is garbage collected or the interpreter exits.
+        """
+        partial = self._partial_path()
+        partial.parent.mkdir(parents=True, exist_ok=True)
+        self._stream = partial.open("w", encoding="utf-8", newline="\n", buffering=1 << 16)
+        self._stream_cleanup = weakref.finalize(self, _discard_partial, self._stream, partial)
+
+    def _partial_path(self) -> Path:
+        """Path the report is streamed to before ``save()`` moves it into place."""
+        return self.out_path.with_name(self.out_path.name + ".part")
+
+    def _finish_stream(self, skip_unchanged: bool) -> Path:
+        """Append the artifacts index to the streamed report and move it into place."""
+        self._ensure_started()
+        self._flush_charts()
+        if self._stream is None or self._stream.closed:
+            return self.out_path
+
+        self._w(f"## Artifacts\n\n{self._asset_mgr.render_index()}")
+        if self._stream_cleanup is not None:
+            self._stream_cleanup.detach()
+        self._stream.close()
+
+        partial = self._partial_path()
+        if skip_unchanged and self._is_unchanged(partial.read_text(encoding="utf-8")):
+            partial.unlink()
+        else:
+            os.replace(partial, self.out_path)
         return self.out_path
 
     def to_markdown(self) -> str:
         """Return the report content as a markdown string without saving."""
+        if self.cfg.streaming:
+            raise RuntimeError("to_markdown() is not available in streaming mode; read the saved file instead")
+        return self._render()
+
+    def _render(self) -> str:
+        """Assemble the report with a single join over the buffered chunks.
+
+        The artifacts index is swapped into its placeholder chunk before
+        joining, so the full report is copied once instead of being joined
+        and then rescanned by ``str.replace``.
+        """
         self._ensure_started()
-        content = "".join(self._chunks)
-        artifact_index = self._asset_mgr.render_index()
-        return content.replace("{{ARTIFACTS_PLACEHOLDER}}", artifact_index)
+        self._flush_charts()
+        chunks = list(self._chunks)
+        chunks[self._artifacts_slot] = f"{self._asset_mgr.render_index()}\n\n---\n\n"
+        return "".join(chunks)
 
 
 class _SectionContext:
@@ -306,6 +550,8 @@ class _SectionContext:
             n.write("...")
     """
 
+    __slots__ = ("_notebook",)
+
     def __init__(self, notebook: Notebook):
         self._notebook = notebook
 
@@ -330,6 +576,8 @@ class _TabGroup:
             n.table(df)
     """
 
+    __slots__ = ("_labels", "_notebook")
+
     def __init__(self, notebook: Any, labels: Sequence[str]):
         self._notebook = notebook
         self._labels = list(labels)
@@ -358,6 +606,8 @@ class _ColumnGroup:
             n.metric("B", "200")
     """
 
+    __slots__ = ("_n", "_notebook")
+
     def __init__(self, notebook: Any, n: int):
         self._notebook = notebook
         self._n = n
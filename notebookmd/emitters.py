@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any
 
-try:
-    import pandas as pd
-except ImportError:
-    pd = None  # type: ignore
+# pandas is optional and never imported here just for type checks: a DataFrame
+# can only reach these emitters once the caller has imported pandas, so it is
+# looked up in ``sys.modules`` at call time instead.
 
 
 def render_md(text: str) -> str:
@@ -15,6 +17,11 @@ def render_md(text: str) -> str:
     return text.rstrip() + "\n\n"
 
 
+def render_bullets(items: Iterable[Any], prefix: str = "- ") -> str:
+    """Render items as a markdown list, one ``prefix``-ed line per item."""
+    return "".join([f"{prefix}{item}\n" for item in items]) + "\n"
+
+
 def render_note(text: str) -> str:
     """Render a callout / note as a blockquote."""
     return f"> **Note:** {text.strip()}\n\n"
@@ -28,9 +35,12 @@ def render_code(source: str, lang: str = "python") -> str:
 def _normalize_table_data(
     data: Any,
     columns: list[str] | None = None,
-) -> tuple[list[str], list[list[Any]]] | None:
+) -> tuple[list[str], list[Sequence[Any]]] | None:
     """Normalize plain-Python data into (headers, rows).
 
+    Row-oriented input keeps its own row objects and column-oriented input is
+    transposed by ``zip``; rows are never copied cell by cell.
+
     Supported formats:
     - list[dict]: each dict is a row, keys are column names
     - list[list|tuple]: each inner sequence is a row
@@ -43,33 +53,42 @@ def _normalize_table_data(
     # list/tuple of dicts → row-oriented
     if isinstance(data, (list, tuple)) and data and isinstance(data[0], dict):
         headers = columns or list(data[0].keys())
-        rows = [[row.get(h, "") for h in headers] for row in data]
+        rows: list[Sequence[Any]] = [[row.get(h, "") for h in headers] for row in data]
         return headers, rows
 
     # list/tuple of lists/tuples → row-oriented
     if isinstance(data, (list, tuple)) and data and isinstance(data[0], (list, tuple)):
         ncols = max(len(r) for r in data)
         headers = list(columns) if columns else [f"col_{i}" for i in range(ncols)]
-        rows = [list(row) for row in data]
-        return headers, rows
+        return headers, list(data)
 
     # dict of sequences → column-oriented
     if isinstance(data, dict) and data:
         headers = list(columns) if columns else list(data.keys())
         values = [data[h] for h in headers]
-        rows = [list(row) for row in zip(*values, strict=True)]
-        return headers, rows
+        return headers, list(zip(*values, strict=True))
 
     return None
 
 
-def _render_md_table(headers: list[str], rows: list[list[Any]]) -> str:
+@functools.lru_cache(maxsize=32)
+def _row_template(ncols: int) -> str:
+    """Return a ``str.format`` template for a pipe-table row with ``ncols`` cells."""
+    return "| " + " | ".join(["{!s}"] * ncols) + " |"
+
+
+def _render_md_table(headers: list[str], rows: list[Sequence[Any]]) -> str:
     """Render a list of headers and rows as a markdown pipe-table."""
+    ncols = len(headers)
+    template = _row_template(ncols)
     lines: list[str] = []
-    lines.append("| " + " | ".join(str(h) for h in headers) + " |")
-    lines.append("| " + " | ".join("---" for _ in headers) + " |")
-    for row in rows:
-        lines.append("| " + " | ".join(str(v) for v in row) + " |")
+    lines.append(template.format(*headers))
+    lines.append("| " + " | ".join(["---"] * ncols) + " |")
+    # Rows of the expected width go through the precomputed template in one
+    # C-level format call; ragged rows fall back to a plain join.
+    lines.extend(
+        [template.format(*row) if len(row) == ncols else "| " + " | ".join(map(str, row)) + " |" for row in rows]
+    )
     return "\n".join(lines) + "\n"
 
 
@@ -102,10 +121,11 @@ def render_table(
     chunks.append(f"#### {name}\n\n")
 
     # ── pandas DataFrame path ────────────────────────────────────────────
+    pd = sys.modules.get("pandas")
     if pd is not None and hasattr(data, "to_markdown") and hasattr(data, "columns"):
         nrows = len(data)
         ncols = len(data.columns)
-        view = data.head(max_rows).copy()
+        view = data.head(max_rows)  # already a new frame; to_markdown never mutates it
 
         if nrows > max_rows:
             ellipsis_row = {col: "…" for col in view.columns}
@@ -161,18 +181,21 @@ def render_figure(rel_path: str, caption: str = "", filename: str = "") -> str:
     return "".join(chunks)
 
 
-def render_kv(data: dict[str, Any], title: str = "Metrics") -> str:
+def render_kv(data: Mapping[Any, Any] | Iterable[tuple[Any, Any]], title: str = "Metrics") -> str:
     """Render a key-value dictionary as a markdown table.
 
     Args:
-        data: Dictionary of metric names to values.
+        data: Mapping of metric names to values (a dict, a pandas Series, ...), or an
+            iterable of ``(key, value)`` pairs.
         title: Section heading.
 
     Returns:
         Markdown table with Key and Value columns.
     """
+    # Anything with .items() is a mapping here, which also covers pandas Series.
+    items = data.items() if hasattr(data, "items") else data
     lines = [f"#### {title}\n\n", "| Key | Value |\n", "| --- | --- |\n"]
-    for k, v in data.items():
+    for k, v in items:
         lines.append(f"| {k} | {v} |\n")
     lines.append("\n")
     return "".join(lines)
@@ -190,7 +213,9 @@ def render_summary(df_obj: Any, title: str = "Data Summary") -> str:
     Returns:
         Markdown summary block.
     """
-    if pd is None:
+    try:
+        import pandas as pd
+    except ImportError:
         return "> **Note:** pandas not installed; cannot generate summary.\n\n"
 
     if not isinstance(df_obj, pd.DataFrame):
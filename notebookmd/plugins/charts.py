@@ -1,15 +1,16 @@
-"""Chart widgets plugin: line_chart, area_chart, bar_chart, figure, plotly_chart, altair_chart."""
+"""Chart widgets plugin: line_chart, area_chart, bar_chart, figure, figure_file, plotly_chart, altair_chart."""
 
 from __future__ import annotations
 
 from collections.abc import Sequence
+from pathlib import Path
 from typing import Any, ClassVar
 
 from ._base import PluginSpec
 
 
 class ChartPlugin(PluginSpec):
-    """Chart widgets: line_chart, area_chart, bar_chart, figure, plotly_chart, altair_chart."""
+    """Chart widgets: line_chart, area_chart, bar_chart, figure, figure_file, plotly_chart, altair_chart."""
 
     name = "charts"
     version = "0.3.0"
@@ -99,7 +100,25 @@ class ChartPlugin(PluginSpec):
         """
         from ..emitters import render_figure
 
-        rel = self._asset_mgr.save_figure(fig, filename, dpi=dpi)
+        rel = self._asset_mgr.save_figure(
+            fig, filename, dpi=dpi, compress_level=self.cfg.png_compress_level, tight=self.cfg.tight_bbox
+        )
+        self._w(render_figure(rel, caption=caption, filename=filename))
+        return rel
+
+    def figure_file(self, source: str | Path, filename: str | None = None, caption: str = "") -> str:
+        """Copy an already-rendered image into the assets and emit its markdown link.
+
+        Produces the same output as ``figure()`` for a figure that was saved
+        earlier, e.g. a PNG reused from a previous run.
+
+        Returns:
+            Relative path to the copied image.
+        """
+        from ..emitters import render_figure
+
+        filename = filename or Path(source).name
+        rel = self._asset_mgr.copy_file(source, filename)
         self._w(render_figure(rel, caption=caption, filename=filename))
         return rel
 
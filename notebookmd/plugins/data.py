@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping, Sequence
 from typing import Any, Literal
 
 from ._base import PluginSpec
@@ -72,11 +73,12 @@ class DataPlugin(PluginSpec):
 
         self._w(render_metric(label, value, delta=delta, delta_color=delta_color))
 
-    def metric_row(self, metrics: list[dict[str, Any]]) -> None:
+    def metric_row(self, metrics: Sequence[dict[str, Any] | tuple[Any, ...]]) -> None:
         """Display multiple metrics side-by-side in a single row.
 
         Args:
-            metrics: List of dicts with keys: label, value, delta (optional), delta_color (optional).
+            metrics: List of dicts with keys: label, value, delta (optional), delta_color (optional),
+                or tuples of ``(label, value[, delta[, delta_color]])``.
         """
         from ..widgets import render_metric_row
 
@@ -93,8 +95,8 @@ class DataPlugin(PluginSpec):
 
         self._w(render_json(data, expanded=expanded))
 
-    def kv(self, data: dict[str, Any], title: str = "Metrics") -> None:
-        """Emit a key-value metrics table."""
+    def kv(self, data: Mapping[Any, Any] | Iterable[tuple[Any, Any]], title: str = "Metrics") -> None:
+        """Emit a key-value metrics table from a mapping (dict, Series) or ``(key, value)`` pairs."""
         from ..emitters import render_kv
 
         self._w(render_kv(data, title))
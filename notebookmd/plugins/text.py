@@ -1,12 +1,15 @@
-"""Text elements plugin: title, header, subheader, caption, md, note, code, text, latex, divider."""
+"""Text elements plugin: title, header, subheader, caption, md, bullets, note, code, text, latex, divider."""
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from typing import Any
+
 from ._base import PluginSpec
 
 
 class TextPlugin(PluginSpec):
-    """Text elements: title, header, subheader, caption, md, note, code, text, latex, divider."""
+    """Text elements: title, header, subheader, caption, md, bullets, note, code, text, latex, divider."""
 
     name = "text"
     version = "0.3.0"
@@ -65,6 +68,17 @@ class TextPlugin(PluginSpec):
 
         self._w(render_md(text))
 
+    def bullets(self, items: Iterable[Any], prefix: str = "- ") -> None:
+        """Emit a bulleted list, one item per line.
+
+        Args:
+            items: List items (already-formatted markdown).
+            prefix: Marker placed before each item, e.g. ``"* "`` or ``"- [ ] "`` for a task list.
+        """
+        from ..emitters import render_bullets
+
+        self._w(render_bullets(items, prefix=prefix))
+
     def note(self, text: str) -> None:
         """Emit a callout / note blockquote."""
         from ..emitters import render_note
@@ -72,10 +86,15 @@ class TextPlugin(PluginSpec):
         self._w(render_note(text))
 
     def code(self, source: str, lang: str = "python") -> None:
-        """Emit a fenced code block."""
-        from ..emitters import render_code
+        """Emit a fenced code block.
 
-        self._w(render_code(source, lang))
+        The fences and the body are buffered as separate chunks so a large
+        source is only copied once, when the report is finally joined.
+        Output is identical to ``render_code(source, lang)``.
+        """
+        self._w(f"```{lang}\n")
+        self._w(source.rstrip())
+        self._w("\n```\n\n")
 
     def text(self, body: str) -> None:
         """Emit fixed-width preformatted text (like st.text).
@@ -98,7 +117,9 @@ class TextPlugin(PluginSpec):
         self._w(render_latex(body))
 
     def divider(self) -> None:
-        """Emit a horizontal divider (like st.divider)."""
-        from ..widgets import render_divider
+        """Emit a horizontal divider (like st.divider).
 
-        self._w(render_divider())
+        The rule is a fixed string, so it is written directly rather than via
+        ``render_divider()``; output is identical.
+        """
+        self._w("---\n\n")
@@ -1,4 +1,4 @@
-"""Utility widgets plugin: write, echo, empty, connection_status, export_csv."""
+"""Utility widgets plugin: write, echo, empty, connection_status, export_csv, export_parquet."""
 
 from __future__ import annotations
 
@@ -8,7 +8,7 @@ from ._base import PluginSpec
 
 
 class UtilityPlugin(PluginSpec):
-    """Utility widgets: write, echo, empty, connection_status, export_csv."""
+    """Utility widgets: write, echo, empty, connection_status, export_csv, export_parquet."""
 
     name = "utility"
     version = "0.3.0"
@@ -52,3 +52,17 @@ class UtilityPlugin(PluginSpec):
         display_name = name or filename
         self._w(f"**Exported:** [{display_name}]({rel})\n\n")
         return rel
+
+    def export_parquet(self, df: Any, filename: str, name: str | None = None) -> str:
+        """Save a DataFrame as Parquet and link it in the artifacts.
+
+        Faster to write and smaller than CSV, and keeps column dtypes.
+        Requires pyarrow (``pip install "notebookmd[parquet]"``).
+
+        Returns:
+            Relative path to the saved Parquet file.
+        """
+        rel = self._asset_mgr.save_parquet(df, filename)
+        display_name = name or filename
+        self._w(f"**Exported:** [{display_name}]({rel})\n\n")
+        return rel
@@ -257,10 +257,7 @@ class Runner:
         writer = self._live_writer
 
         def hooked_w(notebook_self: Any, s: str) -> None:
-            original_w(notebook_self, s)
-            # Also call on_write callback if set on the instance
-            if hasattr(notebook_self, "_on_write") and notebook_self._on_write:
-                notebook_self._on_write(s)
+            original_w(notebook_self, s)  # also runs the instance's _on_write callback
             writer.on_write(s)
 
         Notebook._w = hooked_w  # type: ignore[assignment]
@@ -9,13 +9,20 @@ st.success, st.error, st.warning, st.info, st.image, and more.
 from __future__ import annotations
 
 import json as _json
+import sys
+import types
 from collections.abc import Sequence
 from typing import Any, Literal
 
+# pandas is optional and only ever looked up in ``sys.modules``: a DataFrame can
+# only be passed in once the caller has imported pandas, so importing it here
+# would just slow down ``import notebookmd`` for reports that never use it.
+
+_orjson: types.ModuleType | None
 try:
-    import pandas as pd
+    import orjson as _orjson
 except ImportError:
-    pd = None  # type: ignore
+    _orjson = None
 
 
 # ── Data Display ──────────────────────────────────────────────────────────────
@@ -43,14 +50,7 @@ def render_metric(
     if delta is not None:
         try:
             num = float(delta)
-            if delta_color == "off":
-                arrow = ""
-            elif (delta_color == "normal" and num > 0) or (delta_color == "inverse" and num < 0):
-                arrow = "▲ "
-            elif (delta_color == "normal" and num < 0) or (delta_color == "inverse" and num > 0):
-                arrow = "▼ "
-            else:
-                arrow = ""
+            arrow = _delta_arrow(num, delta_color)
             lines.append(f"| {arrow}{delta} |")
         except (ValueError, TypeError):
             lines.append(f"| {delta} |")
@@ -61,38 +61,39 @@ def render_metric(
 
 
 def render_metric_row(
-    metrics: list[dict[str, Any]],
+    metrics: Sequence[dict[str, Any] | tuple[Any, ...]],
 ) -> str:
     """Render multiple metrics side-by-side in a single table row.
 
     Args:
-        metrics: List of dicts with keys: label, value, delta (optional), delta_color (optional).
+        metrics: List of dicts with keys: label, value, delta (optional), delta_color (optional),
+            or tuples of ``(label, value[, delta[, delta_color]])``.
 
     Example::
 
         render_metric_row([
             {"label": "Revenue", "value": "$1.2M", "delta": "+12%"},
             {"label": "Users", "value": "3,400", "delta": "+200"},
-            {"label": "Churn", "value": "2.1%", "delta": "-0.3%", "delta_color": "inverse"},
+            ("Churn", "2.1%", "-0.3%", "inverse"),
         ])
     """
     if not metrics:
         return ""
 
+    rows = [_metric_fields(m) for m in metrics]
+
     headers = []
     alignments = []
     values = []
     deltas = []
-    has_any_delta = any(m.get("delta") is not None for m in metrics)
+    has_any_delta = any(delta is not None for _, _, delta, _ in rows)
 
-    for m in metrics:
-        headers.append(f" **{m['label']}** ")
+    for label, value, delta, delta_color in rows:
+        headers.append(f" **{label}** ")
         alignments.append(" :---: ")
-        values.append(f" **{m['value']}** ")
+        values.append(f" **{value}** ")
 
         if has_any_delta:
-            delta = m.get("delta")
-            delta_color = m.get("delta_color", "normal")
             if delta is not None:
                 try:
                     cleaned = str(delta).replace("%", "").replace(",", "").strip()
@@ -100,14 +101,7 @@ def render_metric_row(
                     if cleaned.startswith("+"):
                         cleaned = cleaned[1:]
                     num = float(cleaned)
-                    if delta_color == "off":
-                        arrow = ""
-                    elif (delta_color == "normal" and num > 0) or (delta_color == "inverse" and num < 0):
-                        arrow = "▲ "
-                    elif (delta_color == "normal" and num < 0) or (delta_color == "inverse" and num > 0):
-                        arrow = "▼ "
-                    else:
-                        arrow = ""
+                    arrow = _delta_arrow(num, delta_color)
                     deltas.append(f" {arrow}{delta} ")
                 except (ValueError, TypeError):
                     deltas.append(f" {delta} ")
@@ -127,6 +121,30 @@ def render_metric_row(
     return "\n".join(lines)
 
 
+# Arrow for (delta_color, sign of the delta); "off" and zero deltas get none.
+_DELTA_ARROWS = {
+    ("normal", 1): "▲ ",
+    ("normal", -1): "▼ ",
+    ("inverse", 1): "▼ ",
+    ("inverse", -1): "▲ ",
+}
+
+
+def _delta_arrow(num: float, delta_color: str) -> str:
+    """Return the arrow prefix for a numeric delta under the given color mode."""
+    return _DELTA_ARROWS.get((delta_color, (num > 0) - (num < 0)), "")
+
+
+def _metric_fields(metric: dict[str, Any] | tuple[Any, ...]) -> tuple[Any, Any, Any, str]:
+    """Unpack a metric dict or ``(label, value[, delta[, delta_color]])`` tuple."""
+    if isinstance(metric, dict):
+        return metric["label"], metric["value"], metric.get("delta"), metric.get("delta_color", "normal")
+    label, value, *rest = metric
+    delta = rest[0] if rest else None
+    delta_color = rest[1] if len(rest) > 1 else "normal"
+    return label, value, delta, delta_color
+
+
 def render_json(data: Any, expanded: bool = True) -> str:
     """Render data as a formatted JSON code block (à la st.json).
 
@@ -136,12 +154,44 @@ def render_json(data: Any, expanded: bool = True) -> str:
     """
     indent = 2 if expanded else None
     try:
-        text = _json.dumps(data, indent=indent, ensure_ascii=False, default=str)
+        text = _dumps_json(data, indent=indent)
     except (TypeError, ValueError):
         text = str(data)
     return f"```json\n{text}\n```\n\n"
 
 
+def _orjson_default(obj: Any) -> Any:
+    # The stdlib encodes float subclasses (e.g. numpy.float64) as numbers; orjson
+    # hands them to ``default`` instead.
+    if isinstance(obj, float):
+        return float(obj)
+    return str(obj)
+
+
+def _dumps_json(data: Any, indent: int | None = 2) -> str:
+    """Serialize like ``json.dumps(data, indent=indent, ensure_ascii=False, default=str)``.
+
+    The stdlib encoder drops to pure Python whenever ``indent`` is set, so
+    pretty-printed output goes through orjson when it is installed. Anything
+    orjson rejects (e.g. ints wider than 64 bits) falls back to the stdlib.
+    The orjson output differs only in exponent spelling (``1e22``), NaN and
+    infinity (``null``) and plain ``Enum`` members (their value).
+    """
+    if indent == 2 and _orjson is not None:
+        options = (
+            _orjson.OPT_INDENT_2
+            | _orjson.OPT_NON_STR_KEYS
+            | _orjson.OPT_PASSTHROUGH_DATETIME
+            | _orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        try:
+            encoded: bytes = _orjson.dumps(data, option=options, default=_orjson_default)
+            return encoded.decode()
+        except TypeError:
+            pass
+    return _json.dumps(data, indent=indent, ensure_ascii=False, default=str)
+
+
 def render_dataframe(
     data: Any,
     name: str = "",
@@ -262,6 +312,7 @@ def _render_chart_description(
     heading = title or chart_type
     lines.append(f"#### {heading}\n")
 
+    pd = sys.modules.get("pandas")
     if pd is not None and hasattr(data, "shape"):
         nrows, ncols = data.shape
         lines.append(f"\n_Chart data: {nrows:,} rows × {ncols:,} cols_\n")
@@ -312,6 +363,13 @@ def render_title(text: str, anchor: str | None = None) -> str:
     return f"# {text}\n\n"
 
 
+def _render_heading(marker: str, text: str, anchor: str | None, divider: bool) -> str:
+    """Build a heading line (plus optional anchor and rule) in a single f-string."""
+    suffix = f" {{#{anchor}}}" if anchor else ""
+    rule = "---\n\n" if divider else ""
+    return f"{marker} {text}{suffix}\n\n{rule}"
+
+
 def render_header(text: str, anchor: str | None = None, divider: bool = False) -> str:
     """Render a header (à la st.header).
 
@@ -320,13 +378,7 @@ def render_header(text: str, anchor: str | None = None, divider: bool = False) -
         anchor: Optional HTML anchor ID.
         divider: If True, add a horizontal rule below.
     """
-    line = f"## {text}"
-    if anchor:
-        line += f" {{#{anchor}}}"
-    result = line + "\n\n"
-    if divider:
-        result += "---\n\n"
-    return result
+    return _render_heading("##", text, anchor, divider)
 
 
 def render_subheader(text: str, anchor: str | None = None, divider: bool = False) -> str:
@@ -337,13 +389,7 @@ def render_subheader(text: str, anchor: str | None = None, divider: bool = False
         anchor: Optional HTML anchor ID.
         divider: If True, add a horizontal rule below.
     """
-    line = f"### {text}"
-    if anchor:
-        line += f" {{#{anchor}}}"
-    result = line + "\n\n"
-    if divider:
-        result += "---\n\n"
-    return result
+    return _render_heading("###", text, anchor, divider)
 
 
 def render_caption(text: str) -> str:
@@ -654,6 +700,7 @@ def render_write(*args: Any) -> str:
     """
     from .emitters import render_table
 
+    pd = sys.modules.get("pandas")
     parts: list[str] = []
     for obj in args:
         if isinstance(obj, str):
@@ -757,6 +804,15 @@ def render_stats(
     return separator.join(parts) + "\n\n"
 
 
+_BADGE_PREFIXES = {
+    "success": "✅ ",
+    "warning": "⚠️ ",
+    "error": "❌ ",
+    "info": "ℹ️ ",
+    "default": "",
+}
+
+
 def render_badge(text: str, style: str = "default") -> str:
     """Render an inline badge/pill label.
 
@@ -769,16 +825,7 @@ def render_badge(text: str, style: str = "default") -> str:
         render_badge("BULLISH", "success")
         # → "**`✅ BULLISH`**"
     """
-    icons = {
-        "success": "✅",
-        "warning": "⚠️",
-        "error": "❌",
-        "info": "ℹ️",
-        "default": "",
-    }
-    icon = icons.get(style, "")
-    prefix = f"{icon} " if icon else ""
-    return f"**`{prefix}{text}`**\n\n"
+    return f"**`{_BADGE_PREFIXES.get(style, '')}{text}`**\n\n"
 
 
 def render_change(
@@ -872,16 +919,22 @@ def render_ranking(
     return line + "\n\n"
 
 
+_ORDINAL_SUFFIXES = {1: "st", 2: "nd", 3: "rd"}
+
+
 def _ordinal_suffix(n: int) -> str:
     """Return ordinal suffix for a number (1st, 2nd, 3rd, 4th, ...)."""
     if 11 <= (n % 100) <= 13:
         return "th"
-    return {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return _ORDINAL_SUFFIXES.get(n % 10, "th")
 
 
 # ── Connection / Data Source ──────────────────────────────────────────────────
 
 
+_CONNECTION_ICONS = {"connected": "🟢", "disconnected": "🔴", "error": "🟡"}
+
+
 def render_connection_status(
     name: str,
     status: Literal["connected", "disconnected", "error"] = "connected",
@@ -894,8 +947,7 @@ def render_connection_status(
         status: Current status.
         details: Optional extra information.
     """
-    icons = {"connected": "🟢", "disconnected": "🔴", "error": "🟡"}
-    icon = icons.get(status, "⚪")
+    icon = _CONNECTION_ICONS.get(status, "⚪")
     line = f"{icon} **{name}**: {status}"
     if details:
         line += f" — {details}"
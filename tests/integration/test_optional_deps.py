@@ -1,6 +1,7 @@
 """Integration tests for graceful degradation when pandas/matplotlib missing."""
 
 import importlib
+import subprocess
 import sys
 
 import pytest
@@ -24,6 +25,19 @@ def _reload_modules_after_test():
     importlib.reload(notebookmd)
 
 
+@pytest.mark.integration
+def test_import_does_not_load_pandas():
+    """Test importing notebookmd leaves pandas unloaded until a caller imports it."""
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys, notebookmd; print('pandas' in sys.modules)"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
 @pytest.mark.integration
 def test_table_without_pandas(tmp_path, monkeypatch):
     """Test render_table() works with plain-Python data when pandas is unavailable."""
@@ -15,7 +15,7 @@ def test_asset_manager_init(tmp_path):
 
     assert am.assets_dir == assets_dir
     assert am.base_dir == tmp_path
-    assert am._artifacts == []
+    assert am.artifacts == []
 
 
 def test_ensure_dir_creates_directory(tmp_path):
@@ -92,6 +92,17 @@ def test_register_deduplicates(tmp_path):
     assert len(am.artifacts) == 1
 
 
+def test_register_keeps_first_registration_order(tmp_path):
+    """Test re-registering a path does not move it."""
+    am = AssetManager(assets_dir=tmp_path, base_dir=tmp_path)
+
+    am.register("b.png")
+    am.register("a.png")
+    am.register("b.png")
+
+    assert am.artifacts == ["b.png", "a.png"]
+
+
 # save_figure() with matplotlib
 @pytest.mark.requires_matplotlib
 def test_save_figure_basic(tmp_path, sample_figure):
@@ -115,6 +126,30 @@ def test_save_figure_custom_dpi(tmp_path, sample_figure):
     assert (tmp_path / "chart.png").exists()
 
 
+@pytest.mark.requires_matplotlib
+def test_save_figure_compress_level(tmp_path, sample_figure):
+    """Test compress_level is passed through to the PNG encoder."""
+    am = AssetManager(assets_dir=tmp_path, base_dir=tmp_path)
+
+    am.save_figure(sample_figure, "default.png")
+    am.save_figure(sample_figure, "stored.png", compress_level=0)
+
+    assert (tmp_path / "stored.png").stat().st_size > (tmp_path / "default.png").stat().st_size
+
+
+@pytest.mark.requires_matplotlib
+def test_save_figure_untight_keeps_full_canvas(tmp_path, sample_figure):
+    """Test tight=False saves the whole canvas at figsize * dpi."""
+    import matplotlib.pyplot as plt
+
+    am = AssetManager(assets_dir=tmp_path, base_dir=tmp_path)
+    width, height = sample_figure.get_size_inches() * 100
+
+    am.save_figure(sample_figure, "full.png", dpi=100, tight=False)
+
+    assert plt.imread(tmp_path / "full.png").shape[:2] == (round(height), round(width))
+
+
 @pytest.mark.requires_matplotlib
 def test_save_figure_registers_artifact(tmp_path, sample_figure):
     """Test artifact tracked in list."""
@@ -240,6 +275,47 @@ def test_save_csv_no_index(tmp_path, sample_df):
     assert "date" in first_line or "value" in first_line
 
 
+# save_parquet() tests
+@pytest.mark.requires_pandas
+def test_save_parquet_roundtrip(tmp_path, sample_df):
+    """Test saves DataFrame to Parquet that reads back unchanged."""
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+    am = AssetManager(assets_dir=tmp_path / "assets", base_dir=tmp_path)
+
+    rel_path = am.save_parquet(sample_df, "data.parquet")
+
+    assert rel_path == "assets/data.parquet"
+    assert "assets/data.parquet" in am.artifacts
+    restored = pd.read_parquet(tmp_path / "assets" / "data.parquet")
+    pd.testing.assert_frame_equal(restored, sample_df.reset_index(drop=True))
+
+
+# copy_file() tests
+def test_copy_file_registers_artifact(tmp_path):
+    """Test copies an existing file into assets and tracks it."""
+    src = tmp_path / "prerendered.png"
+    src.write_bytes(b"png-bytes")
+    am = AssetManager(assets_dir=tmp_path / "assets", base_dir=tmp_path)
+
+    rel_path = am.copy_file(src, "chart.png")
+
+    assert rel_path == "assets/chart.png"
+    assert (tmp_path / "assets" / "chart.png").read_bytes() == b"png-bytes"
+    assert "assets/chart.png" in am.artifacts
+
+
+def test_copy_file_same_path(tmp_path):
+    """Test a file already in the assets directory is registered in place."""
+    am = AssetManager(assets_dir=tmp_path, base_dir=tmp_path)
+    (tmp_path / "chart.png").write_bytes(b"png-bytes")
+
+    rel_path = am.copy_file(tmp_path / "chart.png", "chart.png")
+
+    assert rel_path == "chart.png"
+    assert (tmp_path / "chart.png").read_bytes() == b"png-bytes"
+
+
 # render_index() tests
 def test_render_index_empty(tmp_path):
     """Test returns 'No artifacts generated.' when empty."""
@@ -11,6 +11,7 @@ from notebookmd.cache import (
     CacheStats,
     DiskStore,
     MemoryStore,
+    _code_fingerprint,
     _hash_arg,
     _make_key,
     cache_data,
@@ -80,6 +81,46 @@ class TestKeyHashing:
         h4 = _hash_arg({"b": 2, "a": 1})
         assert h3 == h4  # dict hashing is order-independent
 
+    def test_hash_dataframe_with_strings_by_value(self):
+        pd = pytest.importorskip("pandas")
+        # Equal strings built separately are distinct objects with distinct addresses
+        a = pd.DataFrame({"name": ["".join(["ab", "c"])], "n": [1]})
+        b = pd.DataFrame({"name": ["".join(["a", "bc"])], "n": [1]})
+        assert _hash_arg(a) == _hash_arg(b)
+        assert _hash_arg(a["name"]) == _hash_arg(b["name"])
+        assert _hash_arg(a) != _hash_arg(a.assign(n=[2]))
+
+    def test_hash_dataframe_sampling(self):
+        pd = pytest.importorskip("pandas")
+        a = pd.DataFrame({"x": range(5000)})
+        b = a.copy()
+        b.loc[2500, "x"] = -1
+        assert _hash_arg(a) == _hash_arg(b)  # only head and tail rows are sampled
+        assert _hash_arg(a, sample=False) != _hash_arg(b, sample=False)
+
+    def test_code_fingerprint(self):
+        def f():
+            return [1, 2]
+
+        def g():
+            return [1, 3]
+
+        def h():
+            def inner():
+                return 3
+
+            return inner
+
+        def h2():
+            def inner():
+                return 4
+
+            return inner
+
+        assert _code_fingerprint(f.__code__) == _code_fingerprint(f.__code__)
+        assert _code_fingerprint(f.__code__) != _code_fingerprint(g.__code__)
+        assert _code_fingerprint(h.__code__) != _code_fingerprint(h2.__code__)
+
     def test_make_key_deterministic(self):
         def my_func(x):
             return x
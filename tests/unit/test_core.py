@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from notebookmd import Notebook, NotebookConfig
 
 
@@ -12,6 +14,9 @@ def test_config_defaults():
 
     assert cfg.max_table_rows == 30
     assert cfg.float_format == "{:.4f}"
+    assert cfg.defer_charts is False
+    assert cfg.png_compress_level is None
+    assert cfg.tight_bbox is True
 
 
 def test_config_custom():
@@ -148,6 +153,30 @@ def test_code_emission(tmp_path):
     assert "print('hello')" in md
 
 
+def test_code_emission_buffers_body_without_copy(tmp_path):
+    """Test N.code() keeps the body as its own chunk, matching render_code()."""
+    from notebookmd.emitters import render_code
+
+    N = Notebook(out_md=str(tmp_path / "test.md"))
+    N._ensure_started()
+    body = "line\n" * 1000 + "end"
+
+    N.code(body, lang="markdown")
+
+    assert any(chunk is body for chunk in N._chunks)
+    assert N.to_markdown().endswith(render_code(body, "markdown"))
+
+
+def test_divider_matches_render_divider(tmp_path):
+    """Test N.divider() writes the same rule as render_divider()."""
+    from notebookmd.widgets import render_divider
+
+    N = Notebook(out_md=str(tmp_path / "test.md"))
+    N.divider()
+
+    assert N.to_markdown().endswith(render_divider())
+
+
 def test_kv_emission(tmp_path):
     """Test N.kv() renders Key/Value table."""
     N = Notebook(out_md=str(tmp_path / "test.md"))
@@ -257,6 +286,137 @@ def test_mixed_section_styles(tmp_path):
     assert "More content" in md
 
 
+# cached_block() tests
+@pytest.fixture
+def block_cache(tmp_path):
+    """Point the global cache manager at a temporary directory."""
+    from notebookmd.cache import get_cache_manager, reset_cache_manager
+
+    reset_cache_manager()
+    yield get_cache_manager(tmp_path / "cache")
+    reset_cache_manager()
+
+
+def test_cached_block_replays_output(tmp_path, block_cache):
+    """Test an unchanged block is replayed without running emit again."""
+    out = str(tmp_path / "report.md")
+    calls = []
+
+    def emit():
+        calls.append(1)
+        N.section("Cached")
+        N.md(f"body {N._next_id()}")
+
+    N = Notebook(out_md=out)
+    assert N.cached_block(emit, "v1") is False
+    first = N.to_markdown()
+
+    N = Notebook(out_md=out)
+    assert N.cached_block(emit, "v1") is True
+
+    assert len(calls) == 1
+    assert N.to_markdown().split("---\n\n", 1)[1] == first.split("---\n\n", 1)[1]
+    assert N._counter == 1
+
+
+def test_cached_block_reruns_on_new_inputs(tmp_path, block_cache):
+    """Test changed inputs run emit again."""
+    out = str(tmp_path / "report.md")
+    calls = []
+
+    def emit():
+        calls.append(1)
+        N.md("body")
+
+    N = Notebook(out_md=out)
+    N.cached_block(emit, "v1")
+    N = Notebook(out_md=out)
+
+    assert N.cached_block(emit, "v2") is False
+    assert len(calls) == 2
+
+
+def test_cached_block_reruns_on_config_or_version_change(tmp_path, block_cache, monkeypatch):
+    """Test output rendered under other settings or another release is not replayed."""
+    import notebookmd
+
+    out = str(tmp_path / "report.md")
+    calls = []
+
+    def emit():
+        calls.append(1)
+        N.md("body")
+
+    N = Notebook(out_md=out)
+    N.cached_block(emit)
+    N = Notebook(out_md=out, cfg=NotebookConfig(max_table_rows=5))
+    assert N.cached_block(emit) is False
+
+    monkeypatch.setattr(notebookmd, "__version__", "999.0.0")
+    N = Notebook(out_md=out)
+    assert N.cached_block(emit) is False
+    assert len(calls) == 3
+
+
+def test_cached_block_reruns_when_emit_code_changes(tmp_path, block_cache):
+    """Test editing the block's code is not answered with the old output."""
+    out = str(tmp_path / "report.md")
+
+    def emit():
+        N.md("SUM=1")
+
+    N = Notebook(out_md=out)
+    N.cached_block(emit)
+
+    def emit():  # same qualified name, edited body
+        N.md("SUM=2")
+
+    N = Notebook(out_md=out)
+
+    assert N.cached_block(emit) is False
+    assert "SUM=2" in N.to_markdown()
+
+
+def test_cached_block_sees_changes_in_the_middle_of_large_frames(tmp_path, block_cache):
+    """Test a change outside the head/tail rows of a large frame re-runs the block."""
+    pd = pytest.importorskip("pandas")
+    out = str(tmp_path / "report.md")
+    df = pd.DataFrame({"x": range(5000)})
+
+    def emit():
+        N.md(f"SUM={df['x'].sum()}")
+
+    N = Notebook(out_md=out)
+    N.cached_block(emit, df)
+    df.loc[2500, "x"] = 1_000_000_000
+    N = Notebook(out_md=out)
+
+    assert N.cached_block(emit, df) is False
+    assert f"SUM={df['x'].sum()}" in N.to_markdown()
+
+
+def test_cached_block_reruns_when_artifact_missing(tmp_path, block_cache):
+    """Test a cached block whose artifact file is gone is rebuilt."""
+    out = str(tmp_path / "report.md")
+    src = tmp_path / "chart.png"
+    src.write_bytes(b"png")
+
+    def emit():
+        N.figure_file(src, "chart.png")
+
+    N = Notebook(out_md=out)
+    N.cached_block(emit)
+    (tmp_path / "assets" / "chart.png").unlink()
+
+    N = Notebook(out_md=out)
+    assert N.cached_block(emit) is False
+    assert N._asset_mgr.artifacts == ["assets/chart.png"]
+
+    N = Notebook(out_md=out)
+    assert N.cached_block(emit) is True
+    assert N._asset_mgr.artifacts == ["assets/chart.png"]
+
+
 # Text element tests (renamed from st_ prefix)
 def test_title_method(tmp_path):
     """Test title() renders # heading."""
@@ -355,3 +515,185 @@ def test_save_returns_path(tmp_path):
 
     assert isinstance(result, Path)
     assert result == out_path
+
+
+def test_save_skip_unchanged_keeps_existing_file(tmp_path):
+    """Test skip_unchanged leaves an identical report (timestamp aside) alone."""
+    out_path = tmp_path / "stable.md"
+    N = Notebook(out_md=str(out_path), title="Stable")
+    N.note("Hello")
+    N.save()
+
+    original = out_path.read_text().replace("_Generated: ", "_Generated: 1999-01-01 ")
+    out_path.write_text(original)
+
+    N2 = Notebook(out_md=str(out_path), title="Stable")
+    N2.note("Hello")
+    N2.save(skip_unchanged=True)
+
+    assert out_path.read_text() == original
+
+
+def test_save_skip_unchanged_writes_changed_content(tmp_path):
+    """Test skip_unchanged still writes when the report body differs."""
+    out_path = tmp_path / "changed.md"
+    N = Notebook(out_md=str(out_path), title="Changed")
+    N.note("Hello")
+    N.save()
+
+    N2 = Notebook(out_md=str(out_path), title="Changed")
+    N2.note("Goodbye")
+    N2.save(skip_unchanged=True)
+
+    assert "Goodbye" in out_path.read_text()
+
+
+def test_deferred_charts_drawn_on_save(tmp_path):
+    """Test defer_charts queues chart images until the report is saved."""
+    pytest.importorskip("matplotlib")
+    pytest.importorskip("pandas")
+    out_path = tmp_path / "charts.md"
+    N = Notebook(out_md=str(out_path), title="Charts", cfg=NotebookConfig(defer_charts=True))
+
+    rels = [
+        N.line_chart({"a": [1, 2, 3]}, title="Line"),
+        N.bar_chart({"b": [3, 1, 2]}, title="Bar"),
+    ]
+
+    assert all(rels)
+    assert not any((tmp_path / rel).exists() for rel in rels)
+
+    N.save()
+
+    assert all((tmp_path / rel).exists() for rel in rels)
+    assert rels[0] in out_path.read_text()
+
+
+def test_deferred_chart_snapshots_data(tmp_path, monkeypatch):
+    """Test a deferred chart plots the data as it was when the chart was queued."""
+    pytest.importorskip("matplotlib")
+    pd = pytest.importorskip("pandas")
+    import notebookmd.core as core
+
+    drawn = []
+    monkeypatch.setattr(core, "_draw_mpl_chart", lambda *job: drawn.append(job[1]))
+    N = Notebook(out_md=str(tmp_path / "r.md"), cfg=NotebookConfig(defer_charts=True))
+    df = pd.DataFrame({"day": [1, 2, 3], "close": [1.0, 2.0, 3.0], "other": ["a", "b", "c"]})
+
+    N.line_chart(df, x="day", y="close")
+    df.loc[0, "close"] = 99.0
+    N.save()
+
+    assert drawn[0].columns.tolist() == ["day", "close"]
+    assert drawn[0]["close"].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_deferred_charts_leave_start_method_unset(tmp_path):
+    """Test drawing deferred charts does not fix the process-wide start method."""
+    import multiprocessing
+
+    pytest.importorskip("matplotlib")
+    pytest.importorskip("pandas")
+    before = multiprocessing.get_start_method(allow_none=True)
+    N = Notebook(out_md=str(tmp_path / "r.md"), cfg=NotebookConfig(defer_charts=True))
+
+    N.line_chart({"a": [1, 2, 3]})
+    N.bar_chart({"b": [3, 1, 2]})
+    N.save()
+
+    assert multiprocessing.get_start_method(allow_none=True) == before
+
+
+def test_deferred_charts_drawn_in_process_without_fork(tmp_path, monkeypatch):
+    """Test deferred charts skip the process pool when workers would re-import __main__."""
+    pytest.importorskip("matplotlib")
+    pytest.importorskip("pandas")
+    import notebookmd.core as core
+
+    drawn = []  # a process pool could not pickle this recorder
+    monkeypatch.setattr(core, "_draw_mpl_chart", lambda *job: drawn.append(job[7]))
+    monkeypatch.setattr(core.multiprocessing, "get_start_method", lambda allow_none=False: "spawn")
+    N = Notebook(out_md=str(tmp_path / "r.md"), cfg=NotebookConfig(defer_charts=True))
+
+    N.line_chart({"a": [1, 2, 3]})
+    N.bar_chart({"b": [3, 1, 2]})
+    N.save()
+
+    assert len(drawn) == 2
+
+
+def test_streaming_writes_report_on_save(tmp_path):
+    """Test streaming mode writes chunks to disk and appends the artifacts index."""
+    out_path = tmp_path / "streamed.md"
+    N = Notebook(out_md=str(out_path), title="Streamed", cfg=NotebookConfig(streaming=True))
+    N.section("Intro")
+    N.note("Hello")
+
+    assert N._chunks == []
+    assert not out_path.exists()
+
+    N.save()
+    content = out_path.read_text()
+
+    assert content.startswith("# Streamed\n")
+    assert content.index("## Intro") < content.index("## Artifacts")
+    assert "_No artifacts generated._" in content
+    assert not (tmp_path / "streamed.md.part").exists()
+
+
+def test_streaming_keeps_content_written_before_first_section(tmp_path):
+    """Test widgets called before any heading are streamed, in buffered-mode order."""
+    buffered = Notebook(out_md=str(tmp_path / "buffered.md"), title="T")
+    streamed = Notebook(out_md=str(tmp_path / "streamed.md"), title="T", cfg=NotebookConfig(streaming=True))
+    for N in (buffered, streamed):
+        N.md("INTRO-TEXT")
+        N.section("S")
+        N.md("BODY")
+
+    content = streamed.save().read_text()
+    expected = buffered.to_markdown()
+
+    assert "INTRO-TEXT" in content
+    assert content.index("INTRO-TEXT") < content.index("## S") < content.index("BODY")
+    assert content.index("INTRO-TEXT") == expected.index("INTRO-TEXT")
+
+
+def test_streaming_unfinished_report_removes_partial_file(tmp_path):
+    """Test the partial file is deleted when a streamed report is abandoned before save()."""
+    import gc
+
+    partial = tmp_path / "s.md.part"
+    N = Notebook(out_md=str(tmp_path / "s.md"), cfg=NotebookConfig(streaming=True))
+    N.md("started")
+    assert partial.exists()
+
+    del N
+    gc.collect()
+
+    assert not partial.exists()
+    assert not (tmp_path / "s.md").exists()
+
+
+def test_streaming_write_after_save_raises(tmp_path):
+    """Test widget calls after a streamed save() fail with a clear error."""
+    N = Notebook(out_md=str(tmp_path / "s.md"), cfg=NotebookConfig(streaming=True))
+    N.section("A")
+    N.save()
+    with pytest.raises(RuntimeError, match="already saved"):
+        N.md("late")
+
+
+def test_streaming_uses_lf_line_endings(tmp_path):
+    """Test the streamed file uses \\n line endings like buffered save()."""
+    N = Notebook(out_md=str(tmp_path / "s.md"), cfg=NotebookConfig(streaming=True))
+    N.section("A")
+    N.md("line one\nline two")
+    assert b"\r\n" not in N.save().read_bytes()
+
+
+def test_streaming_to_markdown_unavailable(tmp_path):
+    """Test to_markdown() refuses to run when nothing is kept in memory."""
+    N = Notebook(out_md=str(tmp_path / "s.md"), cfg=NotebookConfig(streaming=True))
+
+    with pytest.raises(RuntimeError, match="streaming"):
+        N.to_markdown()
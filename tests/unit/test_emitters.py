@@ -3,6 +3,7 @@
 import pytest
 
 from notebookmd.emitters import (
+    render_bullets,
     render_code,
     render_figure,
     render_kv,
@@ -28,6 +29,21 @@ def test_render_md_strips_trailing():
     assert result == "Hello\n\n"
 
 
+# render_bullets() tests
+def test_render_bullets_matches_md_list():
+    """Test bullets render exactly like the equivalent hand-written md list."""
+    result = render_bullets(("One", "**Two**"))
+
+    assert result == render_md("- One\n- **Two**")
+
+
+def test_render_bullets_prefix():
+    """Test a custom marker is used for every item."""
+    result = render_bullets(["a", "b"], prefix="- [ ] ")
+
+    assert result == "- [ ] a\n- [ ] b\n\n"
+
+
 # render_note() tests
 def test_render_note_blockquote():
     """Test format as > **Note:** {text}."""
@@ -188,6 +204,33 @@ def test_render_table_list_of_tuples():
     assert "| Bob | 25 |" in result
 
 
+def test_render_table_ragged_rows():
+    """Test rows shorter than the header still render every cell they have."""
+    data = [("Alice", 30, "NYC"), ("Bob", 25)]
+    result = render_table(data, name="Ragged", columns=["name", "age", "city"])
+
+    assert "| Alice | 30 | NYC |" in result
+    assert "| Bob | 25 |" in result
+
+
+def test_render_table_numpy_scalars_use_str():
+    """Test full-width rows render numpy scalars with str(), like ragged rows."""
+    np = pytest.importorskip("numpy")
+    data = [(np.float32(0.1), np.int64(3)), (np.float32(0.1),)]
+    result = render_table(data, name="Numpy", columns=["x", "n"])
+
+    assert "| 0.1 | 3 |" in result
+    assert "| 0.1 |\n" in result
+
+
+def test_render_table_columns_match_rows():
+    """Test column-oriented data renders exactly like the equivalent rows."""
+    rows = (("Alice", 30), ("Bob", 25))
+    cols = {"name": ("Alice", "Bob"), "age": (30, 25)}
+
+    assert render_table(cols, name="T") == render_table(rows, name="T", columns=["name", "age"])
+
+
 def test_render_table_dict_of_lists():
     """Test column-oriented dict renders as a table."""
     data = {
@@ -291,6 +334,29 @@ def test_render_kv_custom_title():
     assert "#### Custom Title" in result
 
 
+def test_render_kv_pairs_match_dict():
+    """Test (key, value) pairs render the same table as a dict."""
+    pairs = (("Name", "Alice"), ("Age", "30"))
+
+    assert render_kv(pairs, title="User Info") == render_kv(dict(pairs), title="User Info")
+
+
+def test_render_kv_accepts_any_mapping():
+    """Test non-dict mappings render like the equivalent dict."""
+    from types import MappingProxyType
+
+    data = {"Name": "Alice", "Age": 30}
+
+    assert render_kv(MappingProxyType(data)) == render_kv(data)
+
+
+def test_render_kv_accepts_series():
+    """Test a pandas Series renders its index as keys."""
+    pd = pytest.importorskip("pandas")
+
+    assert render_kv(pd.Series({"a": 1, "b": 2})) == render_kv({"a": 1, "b": 2})
+
+
 def test_render_kv_empty_dict():
     """Test header only, no rows for empty dict."""
     result = render_kv({}, title="Empty")
@@ -179,7 +179,19 @@ class TestBuiltinPlugins:
         """TextPlugin exposes expected methods."""
         p = TextPlugin()
         methods = p.get_methods()
-        for m in ["title", "header", "subheader", "caption", "md", "note", "code", "text", "latex", "divider"]:
+        for m in [
+            "title",
+            "header",
+            "subheader",
+            "caption",
+            "md",
+            "bullets",
+            "note",
+            "code",
+            "text",
+            "latex",
+            "divider",
+        ]:
             assert m in methods, f"TextPlugin missing {m}"
 
     def test_data_plugin_methods(self):
@@ -193,7 +205,7 @@ class TestBuiltinPlugins:
         """ChartPlugin exposes expected methods."""
         p = ChartPlugin()
         methods = p.get_methods()
-        for m in ["line_chart", "area_chart", "bar_chart", "figure", "plotly_chart", "altair_chart"]:
+        for m in ["line_chart", "area_chart", "bar_chart", "figure", "figure_file", "plotly_chart", "altair_chart"]:
             assert m in methods, f"ChartPlugin missing {m}"
 
     def test_status_plugin_methods(self):
@@ -228,7 +240,7 @@ class TestBuiltinPlugins:
         """UtilityPlugin exposes expected methods."""
         p = UtilityPlugin()
         methods = p.get_methods()
-        for m in ["write", "echo", "empty", "connection_status", "export_csv"]:
+        for m in ["write", "echo", "empty", "connection_status", "export_csv", "export_parquet"]:
             assert m in methods, f"UtilityPlugin missing {m}"
 
 
@@ -318,6 +330,25 @@ class TestNotebookUse:
         assert "analytics" in plugins
         assert "utility" in plugins
 
+    def test_plugins_prepared_per_notebook(self, tmp_path, monkeypatch):
+        """Each Notebook gets its own plugin instances and the class's current methods."""
+        from notebookmd.plugins.text import TextPlugin
+
+        n1 = Notebook(out_md=str(tmp_path / "a.md"))
+        n2 = Notebook(out_md=str(tmp_path / "b.md"))
+
+        assert n1.get_plugins()["text"] is not n2.get_plugins()["text"]
+
+        monkeypatch.setattr(TextPlugin, "md", lambda self, text: self._w(f"patched: {text}\n\n"))
+        n3 = Notebook(out_md=str(tmp_path / "c.md"))
+        n3.md("x")
+        assert "patched: x" in n3.to_markdown()
+
+        # Bound methods still target their own notebook
+        n1.md("only in a")
+        assert "only in a" in n1.to_markdown()
+        assert "only in a" not in n2.to_markdown()
+
 
 # ── Plugin methods work correctly via Notebook ────────────────────────────────
 
@@ -367,6 +398,60 @@ class TestPluginMethodsViaNotebook:
         assert '"key"' in md
         assert "#### Info" in md
 
+    def test_metric_row_accepts_tuples(self, tmp_path):
+        """metric_row accepts (label, value[, delta[, delta_color]]) tuples."""
+        from notebookmd.widgets import render_metric_row
+
+        dicts = [
+            {"label": "A", "value": "1", "delta": "+5%"},
+            {"label": "B", "value": "2"},
+            {"label": "C", "value": "3", "delta": "-1%", "delta_color": "inverse"},
+        ]
+        tuples = [("A", "1", "+5%"), ("B", "2"), ("C", "3", "-1%", "inverse")]
+
+        assert render_metric_row(tuples) == render_metric_row(dicts)
+
+    def test_metric_delta_arrows(self):
+        """Delta arrows follow delta_color: normal, inverse, off."""
+        from notebookmd.widgets import render_badge, render_metric
+
+        assert "| ▲ 5 |" in render_metric("A", 1, delta=5)
+        assert "| ▼ 5 |" in render_metric("A", 1, delta=5, delta_color="inverse")
+        assert "| ▲ -5 |" in render_metric("A", 1, delta=-5, delta_color="inverse")
+        assert "| 5 |" in render_metric("A", 1, delta=5, delta_color="off")
+        assert "| 0 |" in render_metric("A", 1, delta=0)
+        assert render_badge("UP", "success") == "**`✅ UP`**\n\n"
+        assert render_badge("UP") == "**`UP`**\n\n"
+
+    def test_json_matches_stdlib_formatting(self):
+        """render_json output is the same with or without orjson installed."""
+        import datetime
+        import json
+
+        from notebookmd.widgets import render_json
+
+        data = {"rows": [{"id": 1, "score": 0.5, "tag": "é"}], 2: None, "when": datetime.date(2026, 1, 1)}
+        for expanded in (True, False):
+            expected = json.dumps(data, indent=2 if expanded else None, ensure_ascii=False, default=str)
+            assert render_json(data, expanded=expanded) == f"```json\n{expected}\n```\n\n"
+
+        # ints wider than 64 bits fall back to the stdlib encoder
+        assert "1180591620717411303424" in render_json({"big": 2**70})
+
+    def test_figure_file_copies_into_assets(self, tmp_path):
+        """figure_file copies a pre-rendered image into assets and links it."""
+        src = tmp_path / "cache" / "chart_1234.png"
+        src.parent.mkdir()
+        src.write_bytes(b"\x89PNG fake")
+        n = Notebook(out_md=str(tmp_path / "test.md"))
+
+        rel = n.figure_file(src, "chart.png", caption="Cached chart")
+
+        assert rel == "assets/chart.png"
+        assert (tmp_path / "assets" / "chart.png").read_bytes() == src.read_bytes()
+        assert "![Cached chart](assets/chart.png)" in n.to_markdown()
+        assert rel in n._asset_mgr.artifacts
+
     def test_status_methods(self, tmp_path):
         """Status plugin methods render correctly."""
         n = Notebook(out_md=str(tmp_path / "test.md"))